@@ -1,90 +1,146 @@
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
 from flask_cors import CORS
-import csv
 from datetime import datetime
 import os
-import subprocess
-import json
 import sys
-from modules.config_loader import get_config, save_config, update_section
+import time
+from modules.config_loader import get_config, get_config_version, save_config, update_section, ConfigConflictError
+from modules.config_model import AppConfig, ConfigError
+from modules.history_store import get_history_store
+from modules.event_stream import EventHub
+from modules.bot_supervisor import start_process
+from modules.driver_cache import find_chrome
+from modules.browser_session import SessionManager
+from modules.interaction import InteractionServer, INTERACTION_FILE, read_interaction_file, write_interaction_file
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['X-Total-Count', 'X-Next-Cursor'])
 
 # --- Configuration & Paths ---
-PATH = 'all excels/'  # Keep existing path logic for now, though it should ideally come from config
-INTERACTION_FILE = 'interaction.json'
 bot_process = None
+bot_output = None
+
+# Prompts from a bot started here arrive over `interactions`, the interaction file only serves bots started by hand
+interactions = InteractionServer(on_change=lambda status: events.publish("interaction", status))
 
 # Ensure interaction file exists
 if not os.path.exists(INTERACTION_FILE):
-    with open(INTERACTION_FILE, 'w') as f:
-        json.dump({"status": "idle"}, f)
+    write_interaction_file({"status": "idle"})
 
 def get_interaction_status():
-    try:
-        if os.path.exists(INTERACTION_FILE):
-            with open(INTERACTION_FILE, 'r') as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {"status": "idle"}
-
-def set_interaction_response(response_text):
-    status = get_interaction_status()
-    if status.get("status") == "waiting":
+    status = interactions.status()
+    if status["status"] == "idle":
+        status = read_interaction_file()
+    return status
+
+def set_interaction_response(response_text, request_id=None):
+    if interactions.respond(response_text, request_id):
+        return True
+    status = read_interaction_file()
+    if status.get("status") == "waiting" and request_id in (None, status.get("id")):
         status["status"] = "responded"
         status["response"] = response_text
-        with open(INTERACTION_FILE, 'w') as f:
-            json.dump(status, f)
+        write_interaction_file(status)
         return True
     return False
 
 # --- Helper Functions ---
 
-def find_chrome():
-    """Find Chrome browser installation"""
-    import shutil
-    
-    # Check PATH first
-    chrome_path = shutil.which('google-chrome') or shutil.which('chromium-browser') or shutil.which('chromium') or shutil.which('chrome')
-    if chrome_path:
-        return chrome_path
-    
-    # Check common installation paths
-    common_paths = []
-    
-    if sys.platform == 'win32':
-        # Windows paths
-        common_paths = [
-            os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
-            os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
-            os.path.expandvars(r'%LocalAppData%\Google\Chrome\Application\chrome.exe'),
-            r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
-        ]
-    elif sys.platform == 'darwin':
-        # macOS paths
-        common_paths = [
-            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-            os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'),
-        ]
-    else:
-        # Linux paths
-        common_paths = [
-            '/usr/bin/google-chrome',
-            '/usr/bin/google-chrome-stable',
-            '/usr/bin/chromium',
-            '/usr/bin/chromium-browser',
-            '/snap/bin/chromium',
-        ]
-    
-    for path in common_paths:
-        if os.path.exists(path):
-            return path
-    
-    return None
+def get_log_path():
+    """Path of the bot's log file, as configured in settings"""
+    logs_folder = get_config().get('settings', {}).get('logs_folder_path', "logs/")
+    return os.path.join(logs_folder, "log.txt")
+
+def tail_log(path, lines=100, after_offset=None, block_size=8192, max_bytes=1024 * 1024):
+    """
+    Reads the end of a log file without reading the whole file.
+    * Without `after_offset`: seeks back from the end in `block_size` blocks until `lines` lines are found
+    * With `after_offset`: returns only the complete lines written since that byte offset (at most `max_bytes`)
+    * If the file shrank below `after_offset` (it was rotated), falls back to the last `lines` lines and sets `reset`
+    Returns a dict with the text in `logs`, the byte offset it starts at in `start` and the byte offset to continue from in `offset`.
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        if after_offset is not None and 0 <= after_offset <= size:
+            start = max(after_offset, size - max_bytes)
+            f.seek(start - 1 if start > after_offset else start)
+            at_line_start = start == after_offset or f.read(1) == b'\n'
+            data = f.read(size - start)
+            if not at_line_start:
+                # Too far behind and reading starts mid-line: skip to the first complete line
+                skip = data.find(b'\n') + 1 if b'\n' in data else len(data)
+                data = data[skip:]
+                start += skip
+            # Only hand out complete lines, the rest is picked up by the next poll
+            end = data.rfind(b'\n') + 1
+            return {"logs": data[:end].decode('utf-8', errors='replace'), "start": start, "offset": start + end, "reset": False}
+
+        position = size
+        data = b''
+        while position > 0 and data.count(b'\n') <= lines and len(data) < max_bytes:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+        text_lines = data.splitlines(keepends=True)[-lines:]
+        start = size - sum(len(line) for line in text_lines)
+        return {"logs": b"".join(text_lines).decode('utf-8', errors='replace'), "start": start, "offset": size, "reset": after_offset is not None}
+
+def get_session_manager():
+    """Manages the warm browser that stays open between bot runs when `keep_browser_warm` is on"""
+    return SessionManager(get_config().get('settings', {}).get('driver_cache_path', "drivers/"))
+
+def get_bot_status():
+    """Returns 'running' or 'stopped' and the exit code of the last run, if any"""
+    if bot_process is None:
+        return {"status": "stopped"}
+    exit_code = bot_process.poll()
+    if exit_code is None:
+        return {"status": "running"}
+    return {"status": "stopped", "exit_code": exit_code}
+
+# --- Live Events (Server-Sent Events) ---
+# One poller thread watches the log file, bot process and interaction file for all open dashboards.
+events = EventHub()
+_watched = {"log_offset": None, "status": None, "interaction_mtime": None}
+
+def reset_watched():
+    _watched.update(log_offset=None, status=None, interaction_mtime=None)
+
+def log_events():
+    log_path = get_log_path()
+    if not os.path.exists(log_path):
+        return []
+    size = os.path.getsize(log_path)
+    start = _watched["log_offset"]
+    if start is None or size == start:
+        # Clients get their own initial tail when connecting, so only changes after that are published
+        _watched["log_offset"] = size
+        return []
+    result = tail_log(log_path, 200, start)
+    _watched["log_offset"] = result["offset"]
+    if not result["logs"] and not result["reset"]:
+        return []
+    return [("log", result)]
+
+def status_events():
+    status = get_bot_status()
+    if status == _watched["status"]:
+        return []
+    _watched["status"] = status
+    return [("status", status)]
+
+def interaction_events():
+    mtime = os.path.getmtime(INTERACTION_FILE) if os.path.exists(INTERACTION_FILE) else None
+    if mtime == _watched["interaction_mtime"]:
+        return []
+    _watched["interaction_mtime"] = mtime
+    return [("interaction", get_interaction_status())]
+
+events.add_source(log_events, reset_watched)
+events.add_source(status_events)
+events.add_source(interaction_events)
 
 # --- Routes ---
 
@@ -93,22 +149,70 @@ def home():
     """Displays the home page of the application."""
     return render_template('index.html')
 
+def get_if_match():
+    """The version a client based its edit on, from the `If-Match` header (None if not sent)"""
+    value = request.headers.get('If-Match')
+    if not value or value.strip() == '*':
+        return None
+    return value.strip().removeprefix('W/').strip('"')
+
+def config_response(body, status=200):
+    """JSON response carrying the current config version as its ETag"""
+    response = jsonify(body)
+    response.status_code = status
+    response.set_etag(get_config_version())
+    return response
+
+def config_conflict():
+    return config_response({
+        "error": "Configuration was changed elsewhere",
+        "details": ["Reload the configuration and apply your changes again."]
+    }, 412)
+
 @app.route('/api/config', methods=['GET'])
 def get_configuration():
-    return jsonify(get_config())
+    # Version first, so a concurrent write makes the ETag stale rather than the data
+    version = get_config_version()
+    response = jsonify(get_config())
+    response.set_etag(version)
+    return response
 
 @app.route('/api/config', methods=['POST'])
 def save_configuration():
+    """Replaces the whole configuration. Send the ETag from `GET /api/config` as `If-Match` to avoid overwriting other edits."""
     try:
         new_config = request.json
-        save_config(new_config)
-        return jsonify({"message": "Configuration saved successfully"}), 200
+        save_config(new_config, get_if_match(), AppConfig.from_dict)
+        return config_response({"message": "Configuration saved successfully"})
+    except ConfigConflictError:
+        return config_conflict()
+    except ConfigError as e:
+        return jsonify({"error": "Invalid configuration", "details": e.errors}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/config/<section>', methods=['PATCH'])
+def patch_configuration(section):
+    """
+    Updates only the given keys of one config section, e.g. `PATCH /api/config/settings {"click_gap": 2}`.
+    Honors `If-Match` like `POST /api/config`, and returns the new ETag.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    try:
+        update_section(section, data, get_if_match(), AppConfig.from_dict)
+        return config_response({"message": f"Section '{section}' updated", section: get_config().get(section, {})})
+    except ConfigConflictError:
+        return config_conflict()
+    except ConfigError as e:
+        return jsonify({"error": "Invalid configuration", "details": e.errors}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/bot/start', methods=['POST'])
 def start_bot():
-    global bot_process
+    global bot_process, bot_output
     
     # Check if running in a serverless/restricted environment
     import shutil
@@ -137,6 +241,12 @@ def start_bot():
     except ImportError:
         missing_packages.append("pyautogui")
     
+    # Check the config before the bot spends time launching a browser
+    try:
+        AppConfig.from_dict(get_config())
+    except ConfigError as e:
+        errors.extend(f"Invalid config: {error}" for error in e.errors)
+    
     if missing_packages:
         errors.append(f"Missing Python packages: {', '.join(missing_packages)}. Run: pip install {' '.join(missing_packages)}")
     
@@ -166,28 +276,27 @@ def start_bot():
     
     try:
         # Run runAiBot.py using the current python interpreter
-        bot_process = subprocess.Popen(
-            [sys.executable, 'runAiBot.py'], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
+        # Output is drained continuously by reader threads, so the bot never blocks on a full pipe
+        bot_process, bot_output = start_process(
+            [sys.executable, 'runAiBot.py'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={**os.environ, **interactions.start(), "PYTHONUNBUFFERED": "1"}
         )
         
         # Wait briefly to check if process started successfully
-        import time
         time.sleep(2)
         
         if bot_process.poll() is not None:
             # Process already exited - there was an error
-            stdout, stderr = bot_process.communicate()
-            error_output = stderr or stdout or "Unknown error - bot exited immediately"
+            bot_output.wait_closed(timeout=1)
+            error_output = bot_output.text("stderr") or bot_output.text("stdout") or "Unknown error - bot exited immediately"
             return jsonify({
                 "error": "Bot failed to start",
                 "details": [error_output[:2000]],  # Limit error length
                 "status": "error"
             }), 500
         
+        events.poll_now()
         return jsonify({"message": "Bot started successfully", "pid": bot_process.pid, "status": "running"}), 200
     except Exception as e:
         import traceback
@@ -200,38 +309,41 @@ def start_bot():
 
 @app.route('/api/bot/logs', methods=['GET'])
 def get_bot_logs():
-    """Get the bot's log file contents"""
+    """
+    Get the end of the bot's log file.
+    * `lines`: how many lines to return from the end (default 100)
+    * `after_offset`: the `offset` of a previous response, returns only what was written since
+    """
     try:
-        log_path = "logs/log.txt"
+        log_path = get_log_path()
         if os.path.exists(log_path):
-            with open(log_path, 'r', encoding='utf-8') as f:
-                # Get last 100 lines
-                lines = f.readlines()
-                last_lines = lines[-100:] if len(lines) > 100 else lines
-                return jsonify({"logs": "".join(last_lines)})
-        return jsonify({"logs": "No logs yet"})
+            lines = min(max(request.args.get('lines', 100, type=int), 1), 5000)
+            after_offset = request.args.get('after_offset', None, type=int)
+            return jsonify(tail_log(log_path, lines, after_offset))
+        return jsonify({"logs": "No logs yet", "offset": 0})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/bot/output', methods=['GET'])
 def get_bot_output():
-    """Get real-time output from the bot process"""
-    global bot_process
+    """
+    Get real-time output from the bot process, served from the captured ring buffer.
+    * `max_chars`: how much of the end of each stream to return (default 2000)
+    """
     output = {"stdout": "", "stderr": "", "running": False}
     
     if bot_process:
-        output["running"] = bot_process.poll() is None
+        max_chars = min(max(request.args.get('max_chars', 2000, type=int), 1), 200000)
+        exit_code = bot_process.poll()
+        output["running"] = exit_code is None
         
-        if bot_process.poll() is not None:
-            # Process has ended, get all output
-            try:
-                stdout, stderr = bot_process.communicate(timeout=1)
-                output["stdout"] = stdout[-2000:] if stdout else ""
-                output["stderr"] = stderr[-2000:] if stderr else ""
-                output["exit_code"] = bot_process.returncode
-            except:
-                pass
+        if exit_code is not None:
+            # Process has ended, let the readers pick up whatever it wrote last
+            bot_output.wait_closed(timeout=1)
+            output["exit_code"] = exit_code
+        output["stdout"] = bot_output.text("stdout", max_chars)
+        output["stderr"] = bot_output.text("stderr", max_chars)
     
     return jsonify(output)
 
@@ -241,23 +353,55 @@ def stop_bot():
     if bot_process and bot_process.poll() is None:
         bot_process.terminate()
         bot_process = None
+        events.poll_now()
         return jsonify({"message": "Bot stopped", "status": "stopped"}), 200
     return jsonify({"message": "Bot is not running", "status": "stopped"}), 400
 
+@app.route('/api/bot/events', methods=['GET'])
+def bot_events():
+    """
+    Server-Sent Events stream for the dashboard. Event types:
+    * `status`: `{"status": "running" | "stopped", "exit_code"?: int}`, sent when it changes
+    * `interaction`: the bot's interaction state, sent when it changes
+    * `log`: `{"logs", "offset", "start", "reset"}`, new log lines (`reset` means replace, not append)
+    """
+    subscriber = events.subscribe()
+    initial = [("status", get_bot_status()), ("interaction", get_interaction_status())]
+    log_path = get_log_path()
+    if os.path.exists(log_path):
+        initial.append(("log", {**tail_log(log_path, 200), "reset": True}))
+    return Response(
+        stream_with_context(events.stream(subscriber, initial)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/bot/status', methods=['GET'])
 def bot_status():
-    global bot_process
-    status = "stopped"
-    if bot_process and bot_process.poll() is None:
-        status = "running"
-    
     interaction = get_interaction_status()
-    
+
     return jsonify({
-        "status": status,
+        **get_bot_status(),
         "interaction": interaction
     })
 
+@app.route('/api/bot/browser', methods=['GET'])
+def warm_browser_status():
+    """Whether a warm browser is open, with its `pid` and debugging `port`"""
+    state = get_session_manager().warm_browser()
+    if state is None:
+        return jsonify({"warm": False})
+    return jsonify({"warm": True, "pid": state["pid"], "port": state["port"]})
+
+@app.route('/api/bot/browser', methods=['DELETE'])
+def close_warm_browser():
+    """Closes the warm browser, the next start launches a fresh one"""
+    if bot_process and bot_process.poll() is None:
+        return jsonify({"message": "Stop the bot before closing its browser"}), 409
+    if get_session_manager().close_browser():
+        return jsonify({"message": "Browser closed"}), 200
+    return jsonify({"message": "No warm browser is open"}), 404
+
 @app.route('/api/environment/check', methods=['GET'])
 def check_environment():
     """Check if the environment can run the bot and return compatibility info"""
@@ -324,78 +468,86 @@ def check_environment():
 def bot_interact():
     data = request.json
     response_text = data.get('response')
-    if set_interaction_response(response_text):
+    if set_interaction_response(response_text, data.get('id')):
         return jsonify({"message": "Response sent to bot"}), 200
     return jsonify({"error": "Bot is not waiting for input"}), 400
 
+@app.route('/api/bot/interact/wait', methods=['GET'])
+def bot_interact_wait():
+    """
+    Long-poll for a prompt from the bot, returns as soon as one is raised.
+    * `timeout`: seconds to wait before returning `{"status": "idle"}` (default 25, at most 60)
+    * `after_id`: id of a prompt the client already has, so it isn't returned again
+    Answer with `POST /api/bot/interact` passing the prompt's `id`.
+    """
+    timeout = min(max(request.args.get('timeout', 25, type=float), 0), 60)
+    after_id = request.args.get('after_id')
+    deadline = time.monotonic() + timeout
+    while True:
+        # Prompts over IPC wake us immediately, the file fallback is checked between slices
+        prompt = interactions.wait_for_prompt(min(0.5, max(deadline - time.monotonic(), 0)), after_id)
+        if prompt is None:
+            status = read_interaction_file()
+            if status.get("status") == "waiting" and status.get("id") != after_id:
+                prompt = status
+        if prompt is not None:
+            return jsonify(prompt)
+        if time.monotonic() >= deadline:
+            return jsonify({"status": "idle"})
+
+
 
 # --- Existing Routes ---
 
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Retrieves one page of applied jobs from the applications history store.
+    * Query params: `limit` (default 100), `cursor`, `company`, `title`, `date_from`, `date_to`, `sort`, `order`
+    * Total matching jobs is sent in the `X-Total-Count` header, the cursor for the next page in `X-Next-Cursor`
     '''
     try:
+        args = request.args
+        records, next_cursor, total = get_history_store().query_applied(
+            limit=args.get('limit', 100, type=int),
+            cursor=args.get('cursor') or None,
+            company=args.get('company') or None,
+            title=args.get('title') or None,
+            date_from=args.get('date_from') or None,
+            date_to=args.get('date_to') or None,
+            sort=args.get('sort', 'id'),
+            order=args.get('order', 'asc'),
+        )
         jobs = []
-        # Ensure directory exists
-        if not os.path.exists(PATH):
-            os.makedirs(PATH)
-            
-        csv_path = os.path.join(PATH, 'all_applied_applications_history.csv')
-        if not os.path.exists(csv_path):
-             return jsonify([]), 200 # Return empty list if no file
-
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row.get('Job ID', ''),
-                    'Title': row.get('Title', ''),
-                    'Company': row.get('Company', ''),
-                    'HR_Name': row.get('HR Name', ''),
-                    'HR_Link': row.get('HR Link', ''),
-                    'Job_Link': row.get('Job Link', ''),
-                    'External_Job_link': row.get('External Job link', ''),
-                    'Date_Applied': row.get('Date Applied', '')
-                })
-        return jsonify(jobs)
-    except FileNotFoundError:
-        return jsonify({"error": "No applications history found"}), 404
+        for row in records:
+            jobs.append({
+                'Job_ID': row.get('Job ID', ''),
+                'Title': row.get('Title', ''),
+                'Company': row.get('Company', ''),
+                'HR_Name': row.get('HR Name', ''),
+                'HR_Link': row.get('HR Link', ''),
+                'Job_Link': row.get('Job Link', ''),
+                'External_Job_link': row.get('External Job link', ''),
+                'Date_Applied': row.get('Date Applied', '')
+            })
+        response = jsonify(jobs)
+        response.headers['X-Total-Count'] = str(total)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history store.
     """
     try:
-        data = []
-        csvPath = os.path.join(PATH, 'all_applied_applications_history.csv')
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-        
-        if not found:
+        if not get_history_store().update_date_applied(job_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S')):
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
-
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
-        
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
         print(f"Error updating applied date: {str(e)}")  # Debug log
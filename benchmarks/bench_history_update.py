@@ -0,0 +1,103 @@
+'''
+Benchmark for `PUT /applied-jobs/<job_id>`: latency of updating one "Date Applied" value
+as the application history grows.
+
+Compares the SQLite history store against the old approach of rewriting the whole CSV.
+
+Usage:
+    python benchmarks/bench_history_update.py [--sizes 1000 10000 100000 1000000] [--updates 200] [--csv-max 100000]
+'''
+
+import argparse
+import csv
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.history_store import APPLIED_COLUMNS, SqliteHistoryStore
+
+
+def make_record(i: int) -> dict:
+    return {
+        'Job ID': str(4000000000 + i), 'Title': f"Software Engineer {i % 97}", 'Company': f"Company {i % 5003}",
+        'Work Location': "Remote", 'Work Style': "Remote", 'About Job': "Lorem ipsum " * 20,
+        'Date Applied': f"2024-{1 + i % 12:02d}-{1 + i % 28:02d} 12:00:00", 'Job Link': f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+        'External Job link': "Easy Applied",
+    }
+
+
+def populate_store(path: str, size: int) -> SqliteHistoryStore:
+    store = SqliteHistoryStore(path)
+    batch = 50000
+    for start in range(0, size, batch):
+        store.add_many("applied", [make_record(i) for i in range(start, min(size, start + batch))])
+    return store
+
+
+def populate_csv(path: str, size: int) -> None:
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS))
+        writer.writeheader()
+        for i in range(size):
+            writer.writerow(make_record(i))
+
+
+def csv_update(path: str, job_id: str) -> None:
+    '''The pre-SQLite `update_applied_date()`: read every row, rewrite every row.'''
+    data = []
+    with open(path, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        field_names = reader.fieldnames
+        for row in reader:
+            if row['Job ID'] == job_id:
+                row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            data.append(row)
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=field_names)
+        writer.writeheader()
+        writer.writerows(data)
+
+
+def time_calls(fn, args_list: list) -> tuple[float, float]:
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--updates", type=int, default=200, help="Updates timed per size for SQLite")
+    parser.add_argument("--csv-max", type=int, default=100000, help="Largest size to also time the old CSV rewrite for (0 to skip)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} | {'sqlite p50 ms':>13} | {'sqlite p95 ms':>13} | {'csv p50 ms':>10}")
+    print("-" * 56)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            store = populate_store(os.path.join(tmp, f"history_{size}.db"), size)
+            job_ids = [(str(4000000000 + random.randrange(size)),) for _ in range(args.updates)]
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            p50, p95 = time_calls(lambda job_id: store.update_date_applied(job_id, now), job_ids)
+            store.close()
+
+            csv_p50 = "-"
+            if size <= args.csv_max:
+                csv_path = os.path.join(tmp, f"history_{size}.csv")
+                populate_csv(csv_path, size)
+                csv_p50 = f"{time_calls(lambda job_id: csv_update(csv_path, job_id), job_ids[:5])[0]:10.2f}"
+            print(f"{size:>10} | {p50:>13.3f} | {p95:>13.3f} | {csv_p50:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+'''
+Benchmark for the bad word checks in `get_job_description()` and `check_blacklist()`: time to scan one
+job description against a word list.
+
+Compares `WordMatcher` (one Aho-Corasick pass) against the old loop, which lower-cased every word and ran
+one `in` substring scan per word.
+
+Usage:
+    python benchmarks/bench_word_matcher.py [--words 50 400 2000] [--chars 2000 8000] [--runs 300]
+'''
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.word_matcher import WordMatcher
+
+VOCABULARY = [
+    "experience", "engineer", "software", "team", "python", "cloud", "design", "customers", "build", "systems",
+    "remote", "benefits", "salary", "growth", "data", "services", "develop", "product", "quality", "support",
+]
+
+
+def make_words(count: int) -> list[str]:
+    # Made-up words, so none of them occur in the description: the worst case, every word is scanned for
+    return ["".join(random.choices(string.ascii_letters, k=random.randint(4, 14))) + " co" for _ in range(count)]
+
+
+def make_description(chars: int) -> str:
+    words = []
+    while sum(len(word) + 1 for word in words) < chars:
+        words.append(random.choice(VOCABULARY))
+    return " ".join(words)[:chars]
+
+
+def old_find(words: list[str], text: str) -> str | None:
+    '''The pre-`WordMatcher` check: lower-case each word again and scan the text once per word.'''
+    text = text.lower()
+    for word in words:
+        if word.lower() in text:
+            return word
+    return None
+
+
+def time_calls(fn, text: str, runs: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, nargs="+", default=[50, 400, 2000])
+    parser.add_argument("--chars", type=int, nargs="+", default=[2000, 8000])
+    parser.add_argument("--runs", type=int, default=300)
+    args = parser.parse_args()
+    random.seed(0)
+
+    print(f"{'words':>6} | {'chars':>6} | {'build ms':>8} | {'old loop p50 ms':>15} | {'matcher p50 ms':>14} | {'whole words p50 ms':>18}")
+    print("-" * 84)
+    for word_count in args.words:
+        words = make_words(word_count)
+        start = time.perf_counter()
+        matcher = WordMatcher(words)
+        build_ms = (time.perf_counter() - start) * 1000
+        whole_words = WordMatcher(words, whole_words=True)
+        for chars in args.chars:
+            text = make_description(chars)
+            old_p50 = time_calls(lambda text: old_find(words, text), text, args.runs)[0]
+            new_p50 = time_calls(matcher.find_all, text, args.runs)[0]
+            whole_p50 = time_calls(whole_words.find_all, text, args.runs)[0]
+            print(f"{word_count:>6} | {chars:>6} | {build_ms:>8.1f} | {old_p50:>15.3f} | {new_p50:>14.3f} | {whole_p50:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+from collections import deque
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Resource timing entries only appear once a request finishes, so "idle" means nothing finished for `quiet` ms.
+# Entries are read from the index reached last time, leaving the page's own timing buffer untouched.
+# Once that buffer is full (250 entries by default) new entries only reach observers, so one is installed too.
+NETWORK_IDLE_SCRIPT = '''
+const quietMs = arguments[0];
+const entries = performance.getEntriesByType('resource');
+let seen = window.__autoApplySeenEntries || 0;
+if (seen > entries.length) seen = 0; // The page cleared its buffer
+let last = window.__autoApplyLastResponseEnd || 0;
+for (let i = seen; i < entries.length; i++) {
+    if (entries[i].responseEnd > last) last = entries[i].responseEnd;
+}
+window.__autoApplySeenEntries = entries.length;
+window.__autoApplyLastResponseEnd = last;
+if (!window.__autoApplyObserver && window.PerformanceObserver) {
+    window.__autoApplyObserver = new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) {
+            if (entry.responseEnd > (window.__autoApplyLastResponseEnd || 0)) window.__autoApplyLastResponseEnd = entry.responseEnd;
+        }
+    });
+    window.__autoApplyObserver.observe({type: 'resource'});
+}
+return document.readyState === 'complete' && performance.now() - last >= quietMs;
+'''
+
+# Number of job cards on a results page, or 0 while the first card hasn't rendered its link yet
+JOB_LIST_SCRIPT = '''
+const cards = document.querySelectorAll('li[data-occludable-job-id]');
+return cards.length && cards[0].querySelector('a') ? cards.length : 0;
+'''
+
+MODAL_SIGNATURE_SCRIPT = '''
+const modal = arguments[0];
+const progress = modal.querySelector('progress');
+const heading = modal.querySelector('h3');
+return [
+    progress ? progress.value : '',
+    heading ? heading.innerText : '',
+    modal.querySelectorAll('div[data-test-form-element]').length,
+    modal.innerText.length,
+].join('|');
+'''
+
+
+class LatencyStats:
+    """
+    Keeps how long each kind of wait took, so time spent waiting can be traced back to the page it waited on.
+    * Only the last `window` samples of each action are kept
+    * `report()` returns a table with count, median, 95th percentile, max and timeouts per action
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._counts: dict[str, int] = {}
+        self._timeouts: dict[str, int] = {}
+
+    def record(self, action: str, seconds: float, timed_out: bool = False) -> None:
+        self._samples.setdefault(action, deque(maxlen=self.window)).append(seconds)
+        self._counts[action] = self._counts.get(action, 0) + 1
+        if timed_out:
+            self._timeouts[action] = self._timeouts.get(action, 0) + 1
+
+    def summary(self, action: str) -> dict:
+        samples = sorted(self._samples.get(action, ()))
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": self._counts[action],
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+            "timeouts": self._timeouts.get(action, 0),
+        }
+
+    def report(self) -> str:
+        lines = ["Wait latencies (seconds):", f"  {'action':<28}{'count':>7}{'p50':>8}{'p95':>8}{'max':>8}{'timeouts':>10}"]
+        for action in sorted(self._samples):
+            summary = self.summary(action)
+            lines.append(f"  {action:<28}{summary['count']:>7}{summary['p50']:>8.2f}{summary['p95']:>8.2f}{summary['max']:>8.2f}{summary['timeouts']:>10}")
+        return "\n".join(lines)
+
+    def __bool__(self) -> bool:
+        return bool(self._samples)
+
+
+stats = LatencyStats()
+
+
+def wait_for(driver: WebDriver, condition: Callable[[WebDriver], Any], action: str, timeout: float = 10, floor: float = 0, poll: float = 0.1) -> Any:
+    '''
+    Waits until `condition(driver)` returns something truthy, and records how long it took under `action`.
+    * `floor` is a minimum wait, slept before checking the condition
+    * Returns the condition's value, or `False` if it wasn't met within `timeout` seconds
+    '''
+    started = perf_counter()
+    if floor > 0:
+        sleep(floor)
+    try:
+        result = WebDriverWait(driver, timeout, poll).until(condition)
+        stats.record(action, perf_counter() - started)
+        return result
+    except TimeoutException:
+        stats.record(action, perf_counter() - started, timed_out=True)
+        return False
+
+
+def network_idle(quiet: float = 0.5) -> Callable[[WebDriver], bool]:
+    '''
+    Condition: the page finished loading and no request completed in the last `quiet` seconds.
+    '''
+    return lambda driver: driver.execute_script(NETWORK_IDLE_SCRIPT, int(quiet * 1000))
+
+
+def elements_present(by: str, value: str, min_count: int = 1) -> Callable[[WebDriver], list[WebElement] | bool]:
+    '''
+    Condition: at least `min_count` elements match the locator, returns them.
+    '''
+    def condition(driver: WebDriver):
+        elements = driver.find_elements(by, value)
+        return elements if len(elements) >= min_count else False
+    return condition
+
+
+def job_list_rendered(stable: float = 0.3) -> Callable[[WebDriver], int | bool]:
+    '''
+    Condition: the results page shows job cards, the first one has its link and the card count hasn't changed for `stable` seconds.
+    * Returns the card count
+    '''
+    state = {"count": 0, "since": perf_counter()}
+    def condition(driver: WebDriver):
+        count = driver.execute_script(JOB_LIST_SCRIPT)
+        if count != state["count"]:
+            state["count"], state["since"] = count, perf_counter()
+            return False
+        return count if count and perf_counter() - state["since"] >= stable else False
+    return condition
+
+
+def modal_signature(driver: WebDriver, modal: WebElement) -> str:
+    '''
+    Returns a short fingerprint of the Easy Apply `modal`'s current step (progress, heading, questions, text length).
+    '''
+    return driver.execute_script(MODAL_SIGNATURE_SCRIPT, modal)
+
+
+def modal_step_changed(modal: WebElement, previous: str) -> Callable[[WebDriver], bool]:
+    '''
+    Condition: the `modal`'s step differs from the `previous` signature, or the modal closed.
+    '''
+    def condition(driver: WebDriver) -> bool:
+        try:
+            return modal_signature(driver, modal) != previous
+        except WebDriverException:
+            return True # Modal went stale, e.g. it closed after the last step
+    return condition
+
+
+def settle(driver: WebDriver, action: str, floor: float = 0, timeout: float = 5, ready: Callable[[WebDriver], Any] | None = None, idle_cap: float = 1.5) -> bool:
+    '''
+    Waits for the page to settle after a navigation or click, at least `floor` seconds.
+    * With a `ready` condition, waits up to `timeout` for it, then at most `idle_cap` seconds for network idle,
+      as pages that keep polling or sending beacons may never go idle. That wait is recorded as `"<action> idle"`
+    * Without one, waits up to `timeout` for network idle
+    * Returns `False` if the page didn't settle (`ready` not met, or never idle without `ready`)
+    '''
+    if ready is None:
+        return bool(wait_for(driver, network_idle(), action, timeout, floor))
+    if not wait_for(driver, ready, action, timeout, floor):
+        return False
+    wait_for(driver, network_idle(), f"{action} idle", idle_cap)
+    return True
@@ -1,7 +1,8 @@
 ##> ------ Yang Li : MARKYangL - Feature ------
-from modules.config_loader import get_config
+from modules.config_model import get_app_config
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.response_cache import cached_response, store_response, response_key
 
 from pyautogui import confirm
 from openai import OpenAI
@@ -9,16 +10,16 @@ from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from typing import Iterator, Literal
 
-config = get_config()
-secrets = config.get('secrets', {})
-settings = config.get('settings', {})
+config = get_app_config()
+secrets = config.secrets
+settings = config.settings
 
-use_AI = secrets.get('use_AI', False)
-llm_api_url = secrets.get('llm_api_url', "")
-llm_api_key = secrets.get('llm_api_key', "")
-llm_model = secrets.get('llm_model', "")
-showAiErrorAlerts = settings.get('showAiErrorAlerts', False)
-stream_output = secrets.get('stream_output', False)
+use_AI = secrets.use_AI
+llm_api_url = secrets.llm_api_url
+llm_api_key = secrets.llm_api_key
+llm_model = secrets.llm_model
+showAiErrorAlerts = settings.showAiErrorAlerts
+stream_output = secrets.stream_output
 
 def deepseek_create_client() -> OpenAI | None:
     '''
@@ -76,6 +77,14 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
     '''
     if not client: 
         raise ValueError("DeepSeek client is not available!")
+
+    # Models that ignore `temperature` sample at their own default, so their replies aren't deterministic
+    cache_key = response_key("deepseek", llm_model, messages, response_format, temperature if deepseek_model_supports_temperature(llm_model) else None)
+    cached = cached_response(cache_key)
+    if cached is not None:
+        print_lg("\nDeepSeek Answer (cached):\n")
+        print_lg(cached, pretty=response_format is not None)
+        return cached
     ##> ------ Tim L : tulxoro - Improvement ------
     # Set up parameters for the API call
     params = {
@@ -128,6 +137,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
         if response_format:
             result = convert_to_json(result)
         
+        store_response(cache_key, result, "deepseek", llm_model)
         print_lg("\nDeepSeek Answer:\n")
         print_lg(result, pretty=response_format is not None)
         return result
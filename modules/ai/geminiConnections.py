@@ -1,17 +1,18 @@
 import google.generativeai as genai
-from modules.config_loader import get_config
+from modules.config_model import get_app_config
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.response_cache import cached_response, store_response, response_key
 from pyautogui import confirm
 from typing import Literal
 
-config = get_config()
-secrets = config.get('secrets', {})
-settings = config.get('settings', {})
+config = get_app_config()
+secrets = config.secrets
+settings = config.settings
 
-llm_model = secrets.get('llm_model', "")
-llm_api_key = secrets.get('llm_api_key', "")
-showAiErrorAlerts = settings.get('showAiErrorAlerts', False)
+llm_model = secrets.llm_model
+llm_api_key = secrets.llm_api_key
+showAiErrorAlerts = settings.showAiErrorAlerts
 
 def gemini_get_models_list():
     """
@@ -62,17 +63,24 @@ def gemini_create_client():
                 showAiErrorAlerts = False
         return None
 
-def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
+def gemini_completion(model, prompt: str, is_json: bool = False, temperature: float = 0) -> dict | str:
     """
     Generates content using the Gemini model.
     * Takes in `model` - The Gemini model object.
     * Takes in `prompt` of type `str` - The prompt to send to the model.
     * Takes in `is_json` of type `bool` - Whether to expect a JSON response.
+    * Takes in `temperature` of type `float` for randomness control (default 0)
     * Returns the response as a string or a dictionary.
     """
     if not model:
         raise ValueError("Gemini client is not available!")
 
+    cache_key = response_key("gemini", llm_model, prompt, {"json": is_json}, temperature)
+    cached = cached_response(cache_key)
+    if cached is not None:
+        print_lg("Using cached Gemini response.")
+        return cached
+
     try:
         # The Gemini API has a 'safety_settings' parameter to control content filtering.
         # For a job application helper, it's generally safe to set these to a less restrictive level
@@ -97,7 +105,7 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
         ]
 
         print_lg(f"Calling Gemini API for completion...")
-        response = model.generate_content(prompt, safety_settings=safety_settings)
+        response = model.generate_content(prompt, safety_settings=safety_settings, generation_config={"temperature": temperature})
         
         # The response might be blocked. Check for that.
         if not response.parts:
@@ -112,8 +120,9 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
             if result.endswith("```"):
                 result = result[:-3]
             
-            return convert_to_json(result)
-        
+            result = convert_to_json(result)
+
+        store_response(cache_key, result, "gemini", llm_model)
         return result
     except Exception as e:
         critical_error_log(f"Error occurred while getting Gemini completion!", e)
@@ -12,9 +12,10 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
-from modules.config_loader import get_config
+from modules.config_model import get_app_config
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.response_cache import cached_response, store_response, response_key
 
 from pyautogui import confirm
 from openai import OpenAI
@@ -23,21 +24,21 @@ from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from typing import Iterator, Literal
 
 # Load config
-config = get_config()
-secrets = config.get('secrets', {})
-settings = config.get('settings', {})
-personals = config.get('personals', {})
-questions = config.get('questions', {})
-search = config.get('search', {})
+config = get_app_config()
+secrets = config.secrets
+settings = config.settings
+personals = config.personals
+questions = config.questions
+search = config.search
 
 # Map variables
-llm_api_url = secrets.get('llm_api_url', "")
-llm_api_key = secrets.get('llm_api_key', "")
-llm_model = secrets.get('llm_model', "")
-use_AI = secrets.get('use_AI', False)
-llm_spec = secrets.get('llm_spec', "openai")
-showAiErrorAlerts = settings.get('showAiErrorAlerts', False)
-stream_output = secrets.get('stream_output', False)
+llm_api_url = secrets.llm_api_url
+llm_api_key = secrets.llm_api_key
+llm_model = secrets.llm_model
+use_AI = secrets.use_AI
+llm_spec = secrets.llm_spec
+showAiErrorAlerts = settings.showAiErrorAlerts
+stream_output = secrets.stream_output
 
 apiCheckInstructions = """
 
@@ -168,6 +169,14 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     """
     if not client: raise ValueError("Client is not available!")
 
+    # Models that ignore `temperature` sample at their own default, so their replies aren't deterministic
+    cache_key = response_key(f"{llm_spec}:{llm_api_url}", llm_model, messages, response_format, temperature if model_supports_temperature(llm_model) else None)
+    cached = cached_response(cache_key)
+    if cached is not None:
+        print_lg("\nAI Answer to Question (cached):\n")
+        print_lg(cached, pretty=response_format)
+        return cached
+
     params = {"model": llm_model, "messages": messages, "stream": stream}
 
     if model_supports_temperature(llm_model):
@@ -196,6 +205,7 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     if response_format:
         result = convert_to_json(result)
     
+    store_response(cache_key, result, llm_spec, llm_model)
     print_lg("\nAI Answer to Question:\n")
     print_lg(result, pretty=response_format)
     return result
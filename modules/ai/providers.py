@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Callable
+
+# Where each `ai_provider`'s functions live, as (module, function) pairs.
+# Nothing is imported until `load_provider()` is called, so only the selected provider's SDK is loaded.
+PROVIDERS = {
+    "openai": {
+        "create_client": ("modules.ai.openaiConnections", "ai_create_openai_client"),
+        "extract_skills": ("modules.ai.openaiConnections", "ai_extract_skills"),
+        "answer_question": ("modules.ai.openaiConnections", "ai_answer_question"),
+        "close_client": ("modules.ai.openaiConnections", "ai_close_openai_client"),
+    },
+    "deepseek": {
+        "create_client": ("modules.ai.deepseekConnections", "deepseek_create_client"),
+        "extract_skills": ("modules.ai.deepseekConnections", "deepseek_extract_skills"),
+        "answer_question": ("modules.ai.deepseekConnections", "deepseek_answer_question"),
+        # DeepSeek uses the OpenAI compatible client
+        "close_client": ("modules.ai.openaiConnections", "ai_close_openai_client"),
+    },
+    "gemini": {
+        "create_client": ("modules.ai.geminiConnections", "gemini_create_client"),
+        "extract_skills": ("modules.ai.geminiConnections", "gemini_extract_skills"),
+        "answer_question": ("modules.ai.geminiConnections", "gemini_answer_question"),
+        "close_client": None,
+    },
+}
+
+
+def _close_nothing(client) -> None:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class AIProvider:
+    '''
+    The functions of one AI provider, with the same signatures across providers.
+    * `answer_question(client, question, options, question_type, job_description, about_company, user_information_all)`
+    '''
+    name: str
+    create_client: Callable
+    extract_skills: Callable
+    answer_question: Callable
+    close_client: Callable
+
+
+def load_provider(name: str) -> AIProvider:
+    '''
+    Imports the module of AI provider `name` ("openai", "deepseek" or "gemini") and returns its functions.
+    * Raises `ValueError` for an unknown provider
+    '''
+    spec = PROVIDERS.get(name.lower())
+    if spec is None:
+        raise ValueError(f'Unknown AI provider "{name}"! Available: {", ".join(PROVIDERS)}')
+    functions = {
+        role: getattr(import_module(location[0]), location[1]) if location else _close_nothing
+        for role, location in spec.items()
+    }
+    return AIProvider(name.lower(), **functions)
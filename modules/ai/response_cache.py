@@ -0,0 +1,202 @@
+'''
+Disk cache of LLM responses shared by every AI provider.
+
+Responses are stored under a hash of provider, model, prompt, response format and temperature, so a
+prompt that is identical byte for byte (skills of a reposted job, the same question with the same user
+information) is answered from disk instead of being sent and paid for again. Only deterministic
+calls, that send `temperature = 0` to the model, are cached.
+
+The cache is size-bounded: once it holds more than `ai_cache_max_mb`, the least recently used responses
+are deleted. With `ai_cache_bypass`, cached responses are ignored and replaced by fresh ones.
+
+Command line:
+    python -m modules.ai.response_cache stats
+    python -m modules.ai.response_cache clear
+'''
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+
+from modules.config_model import get_app_config
+from modules.database import SqliteDatabase
+from modules.helpers import print_lg
+
+
+def response_key(provider: str, model: str, prompt, response_format: dict | None = None, temperature: float | None = 0) -> str | None:
+    '''
+    Returns the cache key of a completion, or `None` if it shouldn't be cached (non-zero temperature).
+    * `prompt` is the prompt string or the list of chat messages
+    * Pass `temperature = None` when the temperature isn't sent to the model, such calls aren't cached either
+    '''
+    if temperature != 0:
+        return None
+    payload = json.dumps([provider, model, prompt, response_format, temperature], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed, size-bounded LRU cache of LLM responses.
+    * `get(key)` returns the cached response or `None`, `put(key, response)` stores one, `None` keys are ignored
+    * `hits` and `misses` count lookups made by this process, `stats()` adds what's stored on disk
+    * `max_bytes = 0` disables the cache, `bypass = True` skips lookups but still stores fresh responses
+    """
+
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024, bypass: bool = False) -> None:
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.db = SqliteDatabase(path)
+        with self.db.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_responses (key TEXT PRIMARY KEY, provider TEXT NOT NULL, model TEXT NOT NULL, "
+                "response TEXT NOT NULL, size INTEGER NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ai_responses_last_used ON ai_responses (last_used)")
+
+    def get(self, key: str | None):
+        if key is None or self.max_bytes <= 0 or self.bypass:
+            return None
+        with self.db.connection() as conn:
+            row = conn.execute("SELECT response FROM ai_responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE ai_responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str | None, response, provider: str = "", model: str = "") -> None:
+        '''
+        Stores `response` (anything JSON serializable, error replies are skipped) under `key`, evicting the least recently used responses if the cache grows past `max_bytes`.
+        '''
+        if key is None or response is None or self.max_bytes <= 0:
+            return
+        if isinstance(response, dict) and "error" in response:
+            return # e.g. a reply that wasn't valid JSON, worth asking again
+        data = json.dumps(response, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            with self.db.transaction() as conn:
+                previous = conn.execute("SELECT size FROM ai_responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT INTO ai_responses (key, provider, model, response, size, created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET response = excluded.response, size = excluded.size, created = excluded.created, last_used = excluded.last_used",
+                    (key, provider, model, data, size, now, now),
+                )
+                if self._total_bytes is None:
+                    self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM ai_responses").fetchone()[0]
+                else:
+                    self._total_bytes += size - (previous[0] if previous else 0)
+                if self._total_bytes > self.max_bytes:
+                    self._evict(conn)
+
+    def _evict(self, conn) -> None:
+        # Down to 90% of the limit, so the next few puts don't each evict again
+        target = self.max_bytes * 0.9
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM ai_responses ORDER BY last_used"):
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        conn.executemany("DELETE FROM ai_responses WHERE key = ?", evicted)
+
+    def stats(self) -> dict:
+        with self.db.connection() as conn:
+            entries, stored = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ai_responses").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": stored, "max_bytes": self.max_bytes}
+
+    def report(self) -> str:
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = f"{stats['hits'] / lookups:.0%}" if lookups else "n/a"
+        return (
+            f"AI response cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate} hit rate), "
+            f"{stats['entries']} responses stored in {stats['bytes'] / 1024 / 1024:.1f} of {stats['max_bytes'] / 1024 / 1024:.0f} MB"
+        )
+
+    def clear(self) -> int:
+        with self._lock:
+            with self.db.transaction() as conn:
+                removed = conn.execute("DELETE FROM ai_responses").rowcount
+            self._total_bytes = 0
+        return removed
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    '''
+    Returns the process-wide AI response cache configured in `config.json`, creating it on first use.
+    '''
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_app_config().settings
+            _cache = ResponseCache(settings.ai_cache_path, int(settings.ai_cache_max_mb * 1024 * 1024), settings.ai_cache_bypass)
+        return _cache
+
+
+def cached_response(key: str | None):
+    '''
+    Returns the cached response for `key`, or `None`.
+    * Cache errors (locked database, full disk...) are logged and treated as a miss, so they never fail an AI call
+    '''
+    if key is None:
+        return None
+    try:
+        return get_response_cache().get(key)
+    except Exception as e:
+        print_lg("Failed to read the AI response cache!", e)
+        return None
+
+
+def store_response(key: str | None, response, provider: str = "", model: str = "") -> None:
+    '''
+    Caches `response` under `key`, logging and ignoring cache errors so a paid for response is never lost.
+    '''
+    if key is None:
+        return
+    try:
+        get_response_cache().put(key, response, provider, model)
+    except Exception as e:
+        print_lg("Failed to save to the AI response cache!", e)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m modules.ai.response_cache", description="Inspect or empty the AI response cache.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Show how many responses are stored and how much space they use")
+    commands.add_parser("clear", help="Delete every cached response")
+    args = parser.parse_args(argv)
+
+    cache = get_response_cache()
+    if args.command == "stats":
+        stats = cache.stats()
+        print(f"{stats['entries']} responses, {stats['bytes'] / 1024 / 1024:.2f} of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+    else:
+        print(f"Removed {cache.clear()} cached responses.")
+    cache.db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import subprocess
+import threading
+from collections import deque
+
+
+class OutputCapture:
+    """
+    Continuously drains a subprocess's `stdout` and `stderr` pipes into bounded ring buffers.
+    * One daemon reader thread per pipe, so a chatty child never blocks on a full OS pipe buffer
+    * Only the last `max_lines` lines of each stream are kept, older ones are discarded
+    * Can be read at any time while the process runs, not just after it exits
+    """
+
+    def __init__(self, process: subprocess.Popen, max_lines: int = 1000) -> None:
+        self.process = process
+        self._buffers = {"stdout": deque(maxlen=max_lines), "stderr": deque(maxlen=max_lines)}
+        self._lock = threading.Lock()
+        self._readers = [
+            threading.Thread(target=self._drain, args=(name, pipe), name=f"bot-{name}", daemon=True)
+            for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)) if pipe is not None
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def _drain(self, name: str, pipe) -> None:
+        buffer = self._buffers[name]
+        try:
+            for line in iter(pipe.readline, ""):
+                with self._lock:
+                    buffer.append(line)
+        except (OSError, ValueError):
+            pass # Pipe closed underneath us
+        finally:
+            pipe.close()
+
+    def text(self, name: str, max_chars: int | None = None) -> str:
+        '''
+        Returns what is currently buffered for stream `name` ("stdout" or "stderr").
+        * `max_chars` keeps only the end of the output
+        '''
+        with self._lock:
+            text = "".join(self._buffers[name])
+        return text[-max_chars:] if max_chars else text
+
+    def wait_closed(self, timeout: float | None = None) -> None:
+        '''
+        Waits for the readers to hit end of file, so everything the process wrote before exiting is buffered.
+        '''
+        for reader in self._readers:
+            reader.join(timeout)
+
+
+def start_process(args: list[str], cwd: str | None = None, env: dict | None = None, max_lines: int = 1000) -> tuple[subprocess.Popen, OutputCapture]:
+    '''
+    Starts `args` as a subprocess with piped, text mode output and begins capturing it.
+    * Returns the `Popen` object and its `OutputCapture`
+    '''
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        cwd=cwd,
+        env=env
+    )
+    return process, OutputCapture(process, max_lines)
@@ -0,0 +1,186 @@
+import os
+import sys
+import json
+import socket
+import signal
+import subprocess
+import urllib.request
+from time import perf_counter, sleep
+from typing import Callable
+
+from modules.driver_cache import find_chrome, get_chrome_version, DriverCache
+
+STATE_NAME = "session.json"
+PROFILE_NAME = "warm-profile"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _debugger_alive(port: int, timeout: float = 1) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False
+
+
+def is_healthy(driver) -> bool:
+    '''
+    Returns whether `driver` still controls a browser with at least one open window.
+    '''
+    try:
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+class SessionManager:
+    """
+    Creates, health-checks and hands out WebDriver sessions, optionally keeping the browser warm between bot runs.
+    * A warm browser is a Chrome started with a remote debugging port, detached from the bot process
+    * Its pid and port are kept in `session.json` in `state_dir`, so the next bot run attaches to it instead of launching Chrome
+    * Quitting an attached driver only ends chromedriver, the browser and its LinkedIn login stay alive
+    * Warm browsers use their own profile in `state_dir`, Chrome doesn't allow remote debugging on the default profile
+    """
+
+    def __init__(self, state_dir: str, log: Callable[[str], None] = print) -> None:
+        self.state_dir = os.path.abspath(os.path.expanduser(state_dir))
+        self.state_path = os.path.join(self.state_dir, STATE_NAME)
+        self.profile_dir = os.path.join(self.state_dir, PROFILE_NAME)
+        self.log = log
+
+    def _read_state(self) -> dict | None:
+        try:
+            with open(self.state_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, state: dict) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, 'w') as file:
+            json.dump(state, file, indent=4)
+        os.replace(temp_path, self.state_path)
+
+    def _clear_state(self) -> None:
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
+
+    def warm_browser(self) -> dict | None:
+        '''
+        Returns the state (`pid`, `port`, `chrome_version`...) of the running warm browser, or `None` if there is none.
+        * A state file left by a browser that has since exited is removed
+        '''
+        state = self._read_state()
+        if state is None:
+            return None
+        if _debugger_alive(state.get("port", 0)):
+            return state
+        self._clear_state()
+        return None
+
+    def launch_browser(self, arguments: list[str] = (), timeout: float = 20) -> dict:
+        '''
+        Starts a detached Chrome with a remote debugging port and records it as the warm browser.
+        * `arguments` are extra Chrome command line switches, like "--headless=new"
+        * Raises `RuntimeError` if Chrome isn't installed or its debugging port doesn't come up within `timeout` seconds
+        '''
+        chrome_path = find_chrome()
+        if not chrome_path:
+            raise RuntimeError("Chrome is not installed!")
+        port = _free_port()
+        args = [
+            chrome_path,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={self.profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--start-maximized",
+            *arguments,
+        ]
+        # Detached so stopping the bot (or app.py) doesn't take the browser down with it
+        if sys.platform == "win32":
+            flags = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            flags = {"start_new_session": True}
+        process = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **flags)
+        started = perf_counter()
+        while not _debugger_alive(port, 0.5):
+            if process.poll() is not None or perf_counter() - started > timeout:
+                self._kill(process.pid)
+                raise RuntimeError(f"Chrome didn't open its remote debugging port {port} in time!")
+            sleep(0.1)
+        state = {"pid": process.pid, "port": port, "chrome_path": chrome_path, "chrome_version": get_chrome_version(chrome_path)}
+        self._write_state(state)
+        self.log(f"Startup: launched warm browser (pid {process.pid}, port {port}) in {perf_counter() - started:.2f}s")
+        return state
+
+    def attach(self, state: dict, driver_cache_dir: str | None = None):
+        '''
+        Connects a new WebDriver session to the browser described by `state`.
+        * `driver_cache_dir` uses the cached, patched chromedriver for the browser's version when given
+        '''
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        options = webdriver.ChromeOptions()
+        options.debugger_address = f"127.0.0.1:{state['port']}"
+        service = Service()
+        chrome_version = state.get("chrome_version")
+        if driver_cache_dir and chrome_version:
+            try:
+                service = Service(executable_path=DriverCache(driver_cache_dir, self.log).prepare(int(chrome_version.split('.')[0]), chrome_version))
+            except Exception as e:
+                self.log(f"Couldn't prepare a cached chromedriver, letting selenium find one. {e}")
+        return webdriver.Chrome(service=service, options=options)
+
+    def get_driver(self, arguments: list[str] = (), driver_cache_dir: str | None = None):
+        '''
+        Returns a healthy session on the warm browser, launching the browser first if none is running.
+        * A warm browser that doesn't respond to WebDriver is closed and replaced by a fresh one
+        '''
+        started = perf_counter()
+        state = self.warm_browser()
+        if state:
+            try:
+                driver = self.attach(state, driver_cache_dir)
+                if is_healthy(driver):
+                    driver.switch_to.window(driver.window_handles[0])
+                    self.log(f"Startup: reused warm browser (pid {state['pid']}, port {state['port']}) in {perf_counter() - started:.2f}s")
+                    return driver
+                driver.quit()
+            except Exception as e:
+                self.log(f"Warm browser is unresponsive, replacing it. {e}")
+            self.close_browser()
+        state = self.launch_browser(arguments)
+        return self.attach(state, driver_cache_dir)
+
+    @staticmethod
+    def _kill(pid: int) -> None:
+        try:
+            if sys.platform == "win32":
+                subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+            else:
+                os.killpg(pid, signal.SIGTERM)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    def close_browser(self) -> bool:
+        '''
+        Closes the warm browser, if one is running.
+        * Returns whether a browser was closed
+        '''
+        state = self.warm_browser()
+        self._clear_state()
+        if state is None:
+            return False
+        self._kill(state["pid"])
+        self.log(f"Closed warm browser (pid {state['pid']}).")
+        return True
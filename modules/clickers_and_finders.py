@@ -12,7 +12,7 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
-from modules.config_loader import get_config
+from modules.config_model import get_app_config
 from modules.helpers import buffer, print_lg, sleep
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -22,10 +22,10 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.action_chains import ActionChains
 
-config = get_config()
-settings = config.get('settings', {})
-click_gap = settings.get('click_gap', 1)
-smooth_scroll = settings.get('smooth_scroll', False)
+config = get_app_config()
+settings = config.settings
+click_gap = settings.click_gap
+smooth_scroll = settings.smooth_scroll
 
 
 # Click Functions
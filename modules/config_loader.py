@@ -1,40 +1,246 @@
-
 import json
 import os
+import hashlib
+import tempfile
 import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
 _config_lock = threading.Lock()
+# (mtime, size) of the file, the parsed config shared by every caller and its version, swapped as one tuple
+_cache = (None, None, None)
 
-def load_config():
-    """Loads the configuration from the JSON file."""
+
+class FrozenDict(dict):
+    """A `dict` that can't be modified, so a cached config snapshot can be shared safely."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config snapshots are read-only, use load_config() for an editable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """Returns a read-only deep copy of `value`: dicts become `FrozenDict`s and lists become tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Returns an editable deep copy of a frozen snapshot."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ConfigConflictError(Exception):
+    """Raised when config.json changed since the version the caller based its edit on."""
+
+    def __init__(self, expected, current):
+        super().__init__(f"Config was changed elsewhere (expected version {expected}, current version {current})")
+        self.expected = expected
+        self.current = current
+
+
+@contextmanager
+def _locked():
+    """
+    Holds the config lock for this process and an OS file lock shared with other processes (bot and dashboard),
+    so a read-modify-write of config.json can't interleave with another one.
+    """
     with _config_lock:
-        if not os.path.exists(CONFIG_PATH):
-            return {}
+        with open(CONFIG_PATH + '.lock', 'a+') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            elif msvcrt:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                elif msvcrt:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_stamp():
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _version(data):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _read_file():
+    """Returns the parsed config and its version (a hash of the file's contents)."""
+    if not os.path.exists(CONFIG_PATH):
+        return {}, _version(b"")
+    with open(CONFIG_PATH, 'rb') as f:
+        data = f.read()
+    try:
+        return json.loads(data), _version(data)
+    except json.JSONDecodeError:
+        return {}, _version(data)
+
+
+def _write_file(config):
+    """Writes config.json atomically: a temp file is written and synced, then renamed over the old one."""
+    data = json.dumps(config, indent=4).encode('utf-8')
+    directory = os.path.dirname(CONFIG_PATH)
+    fd, temp_path = tempfile.mkstemp(prefix='.config.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, CONFIG_PATH)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if hasattr(os, 'O_DIRECTORY'):
+        # Make the rename itself durable
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
         try:
-            with open(CONFIG_PATH, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    _invalidate()
+    return _version(data)
+
+
+def _check_version(expected_version):
+    if expected_version is None:
+        return
+    current = _read_file()[1]
+    if current != expected_version:
+        raise ConfigConflictError(expected_version, current)
+
+
+def load_config():
+    """Loads the configuration from the JSON file, as a fresh editable dict."""
+    with _config_lock:
+        return _read_file()[0]
+
+def save_config(new_config, expected_version=None, validate=None):
+    """
+    Saves the configuration to the JSON file, atomically.
+    * `expected_version`: if given, raises `ConfigConflictError` unless the file is still at that version
+    * `validate`: called with the config before it's written, can raise to reject it
+    * Returns the new version
+    """
+    if validate:
+        validate(new_config)
+    with _locked():
+        _check_version(expected_version)
+        return _write_file(new_config)
 
-def save_config(new_config):
-    """Saves the configuration to the JSON file."""
+def update_section(section, data, expected_version=None, validate=None):
+    """
+    Updates a specific section of the configuration, atomically and without losing concurrent edits to other keys.
+    Takes the same `expected_version` and `validate` as `save_config()` and returns the new version.
+    """
+    with _locked():
+        _check_version(expected_version)
+        config = _read_file()[0]
+        if section not in config:
+            config[section] = {}
+
+        # Update only provided keys
+        for key, value in data.items():
+            config[section][key] = value
+
+        if validate:
+            validate(config)
+        return _write_file(config)
+
+def _invalidate():
+    global _cache
+    _cache = (None, None, None)
+
+def _cached():
+    global _cache
+    stamp = _file_stamp()
+    cached = _cache
+    if cached[1] is not None and stamp == cached[0]:
+        return cached
     with _config_lock:
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(new_config, f, indent=4)
-
-def update_section(section, data):
-    """Updates a specific section of the configuration."""
-    config = load_config()
-    if section not in config:
-        config[section] = {}
-    
-    # Update only provided keys
-    for key, value in data.items():
-        config[section][key] = value
-        
-    save_config(config)
+        cached = _cache
+        if cached[1] is None or cached[0] != stamp:
+            # Stamp is taken before reading, so a write racing with the read is picked up next call
+            config, version = _read_file()
+            cached = _cache = (stamp, freeze(config), version)
+        return cached
 
 def get_config():
-    """Returns the current configuration (cached or fresh read)."""
-    return load_config()
+    """
+    Returns the current configuration as a read-only snapshot.
+    The file is only parsed again when its modification time or size changes, or after `save_config()`.
+    """
+    return _cached()[1]
+
+def get_config_version():
+    """Returns the version of the current configuration, usable as an ETag and as `expected_version`."""
+    return _cached()[2]
+
+def diff_config(old, new):
+    """Returns the `(section, key)` pairs whose values differ between two configs."""
+    changed = set()
+    for section in set(old) | set(new):
+        old_section, new_section = old.get(section, {}), new.get(section, {})
+        if not isinstance(old_section, dict) or not isinstance(new_section, dict):
+            if old_section != new_section:
+                changed.add((section, None))
+            continue
+        for key in set(old_section) | set(new_section):
+            if key not in old_section or key not in new_section or old_section[key] != new_section[key]:
+                changed.add((section, key))
+    return changed
+
+
+class ConfigWatcher:
+    """
+    Lets a long running process notice edits to config.json without restarting.
+    * `poll()` checks the file's mtime and size at most once every `interval` seconds, so it's cheap to call often
+    * Each change is reported once, as the previous and the new snapshot
+    """
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self.config = get_config()
+        self._next_check = 0.0
+
+    def poll(self):
+        """Returns `(old, new)` snapshots if the config changed since the last call, else `None`."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+        new = get_config()
+        if new is self.config:
+            return None
+        old, self.config = self.config, new
+        return old, new
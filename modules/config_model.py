@@ -0,0 +1,308 @@
+from dataclasses import dataclass, field, fields
+
+from modules.config_loader import get_config
+from modules.word_matcher import WordMatcher
+
+DATE_POSTED_OPTIONS = ("", "Any time", "Past month", "Past week", "Past 24 hours")
+SORT_BY_OPTIONS = ("", "Most recent", "Most relevant")
+AI_PROVIDERS = ("openai", "deepseek", "gemini")
+HISTORY_BACKENDS = ("sqlite",)
+
+
+class ConfigError(ValueError):
+    """Raised when config.json has values of the wrong type or out of range. `errors` lists every problem found."""
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+def _coerce(value, expected, name: str, errors: list[str]):
+    # Values posted from the dashboard form may arrive as strings, e.g. numbers
+    if expected is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+            return value.strip().lower() == "true"
+    elif expected in (int, float):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if expected is float or float(value).is_integer():
+                return expected(value)
+        elif isinstance(value, str):
+            try:
+                return expected(value.strip())
+            except ValueError:
+                pass
+    elif expected is str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+    elif expected == tuple[str, ...]:
+        if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            return tuple(value)
+    errors.append(f"{name}: expected {getattr(expected, '__name__', 'list of text')}, got {value!r}")
+    return None
+
+
+class _Section:
+    """Builds a frozen section dataclass from its dict in config.json, coercing and collecting errors."""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, section: str, data: dict, errors: list[str]):
+        if not isinstance(data, dict):
+            errors.append(f"{section}: expected an object, got {data!r}")
+            data = {}
+        values = {}
+        for item in fields(cls):
+            if not item.init:
+                continue
+            value = data.get(item.name)
+            if value is None:
+                continue # Missing or blank, keep the default
+            coerced = _coerce(value, item.type, f"{section}.{item.name}", errors)
+            if coerced is not None:
+                values[item.name] = coerced
+        instance = cls(**values)
+        instance.validate(section, errors)
+        return instance
+
+    def validate(self, section: str, errors: list[str]) -> None:
+        pass
+
+    def _set(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+
+
+def _check_choice(errors: list[str], name: str, value: str, options: tuple[str, ...]) -> None:
+    if value not in options:
+        errors.append(f"{name}: must be one of {', '.join(repr(option) for option in options)}, got {value!r}")
+
+def _check_min(errors: list[str], name: str, value: float, minimum: float) -> None:
+    if value < minimum:
+        errors.append(f"{name}: must be at least {minimum}, got {value!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalsConfig(_Section):
+    first_name: str = "Sai"
+    middle_name: str = "Vignesh"
+    last_name: str = "Golla"
+    phone_number: str = "9876543210"
+    current_city: str = ""
+    street: str = ""
+    state: str = ""
+    zipcode: str = ""
+    country: str = ""
+    ethnicity: str = "Decline"
+    gender: str = "Decline"
+    disability_status: str = "Decline"
+    veteran_status: str = "Decline"
+    # Derived
+    full_name: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        for name in ("first_name", "middle_name", "last_name"):
+            self._set(name, getattr(self, name).strip())
+        names = (self.first_name, self.middle_name, self.last_name) if self.middle_name else (self.first_name, self.last_name)
+        self._set("full_name", " ".join(names))
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionsConfig(_Section):
+    default_resume_path: str = "all resumes/default/resume.pdf"
+    years_of_experience: str = "5"
+    require_visa: str = "No"
+    website: str = ""
+    linkedIn: str = ""
+    us_citizenship: str = "U.S. Citizen/Permanent Resident"
+    desired_salary: int = 120000
+    current_ctc: int = 80000
+    notice_period: int = 30
+    linkedin_headline: str = ""
+    linkedin_summary: str = ""
+    cover_letter: str = ""
+    user_information_all: str = ""
+    recent_employer: str = "Not Applicable"
+    confidence_level: str = "8"
+    pause_before_submit: bool = True
+    pause_at_failed_question: bool = True
+    overwrite_previous_answers: bool = False
+    # Derived, as the text typed into application forms
+    desired_salary_lakhs: str = field(init=False, default="")
+    desired_salary_monthly: str = field(init=False, default="")
+    current_ctc_lakhs: str = field(init=False, default="")
+    current_ctc_monthly: str = field(init=False, default="")
+    notice_period_months: str = field(init=False, default="")
+    notice_period_weeks: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self._set("desired_salary_lakhs", str(round(self.desired_salary / 100000, 2)))
+        self._set("desired_salary_monthly", str(round(self.desired_salary / 12, 2)))
+        self._set("current_ctc_lakhs", str(round(self.current_ctc / 100000, 2)))
+        self._set("current_ctc_monthly", str(round(self.current_ctc / 12, 2)))
+        self._set("notice_period_months", str(self.notice_period // 30))
+        self._set("notice_period_weeks", str(self.notice_period // 7))
+
+    def validate(self, section: str, errors: list[str]) -> None:
+        for name in ("desired_salary", "current_ctc", "notice_period"):
+            _check_min(errors, f"{section}.{name}", getattr(self, name), 0)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchConfig(_Section):
+    search_terms: tuple[str, ...] = ()
+    search_location: str = "United States"
+    switch_number: int = 30
+    randomize_search_order: bool = False
+    sort_by: str = ""
+    date_posted: str = "Past week"
+    salary: str = ""
+    easy_apply_only: bool = True
+    experience_level: tuple[str, ...] = ()
+    job_type: tuple[str, ...] = ()
+    on_site: tuple[str, ...] = ()
+    companies: tuple[str, ...] = ()
+    location: tuple[str, ...] = ()
+    industry: tuple[str, ...] = ()
+    job_function: tuple[str, ...] = ()
+    job_titles: tuple[str, ...] = ()
+    benefits: tuple[str, ...] = ()
+    commitments: tuple[str, ...] = ()
+    under_10_applicants: bool = False
+    in_your_network: bool = False
+    fair_chance_employer: bool = False
+    pause_after_filters: bool = True
+    about_company_bad_words: tuple[str, ...] = ()
+    about_company_good_words: tuple[str, ...] = ()
+    bad_words: tuple[str, ...] = ()
+    title_bad_words: tuple[str, ...] = ()
+    company_blacklist: tuple[str, ...] = ()
+    location_bad_words: tuple[str, ...] = ()
+    match_whole_words: bool = False
+    security_clearance: bool = False
+    did_masters: bool = False
+    current_experience: int = 5
+    # Derived, word lists compiled into matchers
+    about_company_bad_words_list: WordMatcher = field(init=False, default=None)
+    about_company_good_words_list: WordMatcher = field(init=False, default=None)
+    bad_words_list: WordMatcher = field(init=False, default=None)
+    title_bad_words_list: WordMatcher = field(init=False, default=None)
+    location_bad_words_list: WordMatcher = field(init=False, default=None)
+    # Derived, lower-cased for case-insensitive lookups
+    company_blacklist_set: frozenset = field(init=False, default=frozenset())
+    on_site_set: frozenset = field(init=False, default=frozenset())
+
+    def __post_init__(self) -> None:
+        for name in ("about_company_bad_words", "about_company_good_words", "bad_words", "title_bad_words", "location_bad_words"):
+            self._set(f"{name}_list", WordMatcher(getattr(self, name), self.match_whole_words))
+        self._set("company_blacklist_set", frozenset(company.strip().lower() for company in self.company_blacklist))
+        self._set("on_site_set", frozenset(style.lower() for style in self.on_site))
+
+    def validate(self, section: str, errors: list[str]) -> None:
+        _check_min(errors, f"{section}.switch_number", self.switch_number, 1)
+        _check_min(errors, f"{section}.current_experience", self.current_experience, -1)
+        _check_choice(errors, f"{section}.sort_by", self.sort_by, SORT_BY_OPTIONS)
+        _check_choice(errors, f"{section}.date_posted", self.date_posted, DATE_POSTED_OPTIONS)
+
+
+@dataclass(frozen=True, slots=True)
+class SecretsConfig(_Section):
+    username: str = ""
+    password: str = ""
+    use_AI: bool = False
+    ai_provider: str = "openai"
+    llm_api_url: str = ""
+    llm_api_key: str = ""
+    llm_model: str = ""
+    llm_spec: str = "openai"
+    stream_output: bool = False
+
+    def validate(self, section: str, errors: list[str]) -> None:
+        if self.use_AI:
+            _check_choice(errors, f"{section}.ai_provider", self.ai_provider.lower(), AI_PROVIDERS)
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsConfig(_Section):
+    close_tabs: bool = False
+    follow_companies: bool = False
+    run_non_stop: bool = False
+    alternate_sortby: bool = True
+    cycle_date_posted: bool = True
+    stop_date_cycle_at_24hr: bool = True
+    generated_resume_path: str = "all resumes/"
+    file_name: str = "all excels/all_applied_applications_history.csv"
+    failed_file_name: str = "all excels/all_failed_applications_history.csv"
+    history_backend: str = "sqlite"
+    history_db_path: str = "all excels/applications_history.db"
+    dedupe_ttl_days: float = 30
+    job_cache_ttl_hours: float = 72
+    ai_cache_path: str = "all excels/ai_cache.db"
+    ai_cache_max_mb: float = 50
+    ai_cache_bypass: bool = False
+    logs_folder_path: str = "logs/"
+    driver_cache_path: str = "drivers/"
+    keep_browser_warm: bool = False
+    log_flush_interval: float = 0.5
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_max_age_hours: float = 24
+    log_backup_count: int = 5
+    log_compress: bool = True
+    click_gap: float = 1
+    run_in_background: bool = False
+    disable_extensions: bool = False
+    safe_mode: bool = False
+    smooth_scroll: bool = False
+    keep_screen_awake: bool = True
+    stealth_mode: bool = True
+    showAiErrorAlerts: bool = False
+    config_reload_interval: float = 2
+
+    def validate(self, section: str, errors: list[str]) -> None:
+        _check_choice(errors, f"{section}.history_backend", self.history_backend, HISTORY_BACKENDS)
+        for name in ("log_flush_interval", "log_max_bytes", "log_max_age_hours", "log_backup_count", "click_gap", "config_reload_interval", "dedupe_ttl_days", "job_cache_ttl_hours", "ai_cache_max_mb"):
+            _check_min(errors, f"{section}.{name}", getattr(self, name), 0)
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """
+    Typed, validated view of config.json shared by every module.
+    * Built once per config snapshot by `get_app_config()`, so modules read attributes instead of nested dicts
+    * Derived values (full name, salary in lakhs...) and word lists are computed once, here
+    """
+    personals: PersonalsConfig
+    questions: QuestionsConfig
+    search: SearchConfig
+    secrets: SecretsConfig
+    settings: SettingsConfig
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "AppConfig":
+        '''
+        Builds the config model from the parsed config.json.
+        * Raises `ConfigError` listing every invalid value
+        '''
+        errors = []
+        sections = {item.name: item.type.from_dict(item.name, config.get(item.name, {}), errors) for item in fields(cls)}
+        if errors:
+            raise ConfigError(errors)
+        return cls(**sections)
+
+
+_model_cache = (None, None)
+
+def get_app_config() -> AppConfig:
+    '''
+    Returns the typed model of the current config, rebuilt only when config.json changes.
+    * Raises `ConfigError` if the config is invalid
+    '''
+    global _model_cache
+    config = get_config()
+    cached_config, model = _model_cache
+    if config is not cached_config:
+        model = AppConfig.from_dict(config)
+        _model_cache = (config, model)
+    return model
@@ -0,0 +1,70 @@
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+
+class SqliteDatabase:
+    """
+    Thin wrapper around an embedded SQLite file shared by the bot and the dashboard.
+    * Keeps a small pool of open connections, since Flask serves every request from a fresh thread
+    * Every connection runs in WAL mode, so readers never block the writer and vice versa
+    * `busy_timeout` makes concurrent writers from other processes wait instead of failing
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 10000, pool_size: int = 4) -> None:
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.pool_size = pool_size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection from the pool for the duration of the `with` block."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            if self._idle.qsize() < self.pool_size:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    @contextmanager
+    def transaction(self, immediate: bool = True):
+        """
+        Runs the enclosed statements in a single transaction on a pooled connection.
+        `immediate=True` takes the write lock up front so read-modify-write sequences can't interleave.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Closes every idle connection in the pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
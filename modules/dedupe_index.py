@@ -0,0 +1,299 @@
+'''
+Persistent index of job IDs and companies the bot has already dealt with.
+
+Applied jobs, rejected jobs and blacklisted companies are kept in the `dedupe_keys` table of the
+history database (the exact store) and in a Bloom filter in a memory-mapped file next to it.
+Lookups for keys that were never added, by far the most common case, are answered by the Bloom
+filter without touching SQLite. "Maybe" answers are confirmed with one primary key lookup.
+
+Opening the index maps the Bloom filter file and only replays rows added since it was last
+written, so startup doesn't depend on how much history there is. Rows other writers add later
+(applied jobs saved by the history store, another bot process) are picked up by `refresh()`.
+
+Command line:
+    python -m modules.dedupe_index stats
+    python -m modules.dedupe_index clear [--kind rejected|blacklisted_company]
+'''
+
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime, timedelta
+from typing import Literal
+
+from modules.config_model import get_app_config
+from modules.database import SqliteDatabase
+
+Kind = Literal["applied", "rejected", "blacklisted_company"]
+KINDS = ("applied", "rejected", "blacklisted_company")
+
+# magic, bit count, hash count, capacity, highest dedupe_keys rowid already in the filter
+HEADER = struct.Struct("<8sQIQQ")
+MAGIC = b"AABLOOM1"
+
+
+def bloom_size(capacity: int, error_rate: float) -> tuple[int, int]:
+    '''
+    Returns `(bits, hashes)` for a Bloom filter holding `capacity` keys with a false positive rate of `error_rate`.
+    '''
+    bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """
+    A Bloom filter stored in a memory-mapped file, so it's opened without reading it and updated in place.
+    * `add(key)` sets the key's bits, `key in bloom` is False only if the key was never added
+    """
+
+    def __init__(self, path: str, bits: int, hashes: int, capacity: int, synced_rowid: int = 0) -> None:
+        self.path = path
+        self.bits = bits
+        self.hashes = hashes
+        self.capacity = capacity
+        size = HEADER.size + (bits + 7) // 8
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            with open(path, "wb") as file:
+                file.write(HEADER.pack(MAGIC, bits, hashes, capacity, synced_rowid))
+                file.truncate(size)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    @classmethod
+    def open_existing(cls, path: str) -> "BloomFilter | None":
+        '''
+        Opens the filter at `path`, or returns `None` if it's missing or not a filter file.
+        '''
+        try:
+            with open(path, "rb") as file:
+                magic, bits, hashes, capacity, _ = HEADER.unpack(file.read(HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC or os.path.getsize(path) != HEADER.size + (bits + 7) // 8:
+            return None
+        return cls(path, bits, hashes, capacity)
+
+    @property
+    def synced_rowid(self) -> int:
+        return HEADER.unpack_from(self._map, 0)[4]
+
+    @synced_rowid.setter
+    def synced_rowid(self, rowid: int) -> None:
+        HEADER.pack_into(self._map, 0, MAGIC, self.bits, self.hashes, self.capacity, rowid)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.bits
+
+    def add(self, key: str) -> None:
+        data = self._map
+        for position in self._positions(key):
+            byte = HEADER.size + (position >> 3)
+            data[byte] = data[byte] | (1 << (position & 7))
+
+    def __contains__(self, key: str) -> bool:
+        data = self._map
+        return all(data[HEADER.size + (position >> 3)] & (1 << (position & 7)) for position in self._positions(key))
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+class KeySet:
+    """
+    Set-like view of one kind of key in a `DedupeIndex`, supports `key in keys` and `keys.add(key)`.
+    """
+
+    def __init__(self, index: "DedupeIndex", kind: Kind, reason: str = "") -> None:
+        self.index = index
+        self.kind = kind
+        self.reason = reason
+
+    def __contains__(self, key: str) -> bool:
+        return self.index.contains(self.kind, key)
+
+    def add(self, key: str) -> None:
+        self.index.add(self.kind, key, self.reason)
+
+
+class DedupeIndex:
+    """
+    Persistent, incrementally updated set of applied jobs, rejected jobs and blacklisted companies.
+    * `ttl_days` makes rejected jobs and blacklisted companies count only for that many days (0 keeps them forever), applied jobs never expire
+    * The Bloom filter grows (is rebuilt with twice the capacity) once it holds more keys than it was sized for
+    """
+
+    def __init__(self, db: SqliteDatabase, bloom_path: str, ttl_days: float = 0, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        self.db = db
+        self.bloom_path = bloom_path
+        self.ttl_days = ttl_days
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter.open_existing(bloom_path)
+        with self.db.connection() as conn:
+            max_rowid, self._key_count = conn.execute("SELECT COALESCE(MAX(rowid), 0), COUNT(*) FROM dedupe_keys").fetchone()
+        if self._bloom is None or self._bloom.synced_rowid > max_rowid:
+            # Missing, or the database was replaced underneath it
+            self._rebuild(max(capacity, self._key_count * 2))
+        else:
+            self._catch_up()
+
+    @staticmethod
+    def _bloom_key(kind: Kind, key: str) -> str:
+        return f"{kind}\0{key}"
+
+    def _rebuild(self, capacity: int) -> None:
+        if self._bloom is not None:
+            self._bloom.close()
+        temp_path = self.bloom_path + ".tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        bits, hashes = bloom_size(capacity, self.error_rate)
+        bloom = BloomFilter(temp_path, bits, hashes, capacity)
+        synced = count = 0
+        with self.db.connection() as conn:
+            for rowid, kind, key in conn.execute("SELECT rowid, kind, key FROM dedupe_keys"):
+                bloom.add(self._bloom_key(kind, key))
+                synced = max(synced, rowid)
+                count += 1
+        self._key_count = count
+        bloom.synced_rowid = synced
+        bloom.close()
+        os.replace(temp_path, self.bloom_path)
+        self._bloom = BloomFilter.open_existing(self.bloom_path)
+
+    def _catch_up(self) -> None:
+        '''
+        Adds the rows written since the filter was last synced, e.g. applied jobs imported from the dashboard.
+        '''
+        with self.db.connection() as conn:
+            rows = conn.execute("SELECT rowid, kind, key FROM dedupe_keys WHERE rowid > ? ORDER BY rowid", (self._bloom.synced_rowid,)).fetchall()
+        for rowid, kind, key in rows:
+            self._bloom.add(self._bloom_key(kind, key))
+        if rows:
+            self._bloom.synced_rowid = rows[-1][0]
+            self._bloom.flush()
+            # May count keys this process already added out of order, which only makes the filter grow a bit early
+            self._key_count += len(rows)
+        self._grow_if_full()
+
+    def _grow_if_full(self) -> None:
+        if self._key_count > self._bloom.capacity:
+            self._rebuild(self._key_count * 2)
+
+    def refresh(self) -> None:
+        '''
+        Adds keys written by others since the index was opened or last refreshed, like applied jobs saved by the history store.
+        '''
+        with self._lock:
+            self._catch_up()
+
+    def contains(self, kind: Kind, key: str) -> bool:
+        with self._lock:
+            if self._bloom_key(kind, key) not in self._bloom:
+                return False
+        with self.db.connection() as conn:
+            row = conn.execute("SELECT added FROM dedupe_keys WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+        if row is None:
+            return False
+        if kind != "applied" and self.ttl_days > 0:
+            return row[0] >= (datetime.now() - timedelta(days=self.ttl_days)).isoformat(" ", "seconds")
+        return True
+
+    def add(self, kind: Kind, key: str, reason: str = "") -> None:
+        '''
+        Records `key` under `kind`. Adding a key again refreshes when it was added.
+        '''
+        with self._lock:
+            # Bits go first: a crash in between leaves a false positive, which the exact lookup corrects
+            self._bloom.add(self._bloom_key(kind, key))
+            with self.db.transaction() as conn:
+                is_new = conn.execute("SELECT 1 FROM dedupe_keys WHERE kind = ? AND key = ?", (kind, key)).fetchone() is None
+                conn.execute(
+                    "INSERT INTO dedupe_keys (kind, key, added, reason) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (kind, key) DO UPDATE SET added = excluded.added, reason = excluded.reason",
+                    (kind, key, datetime.now().isoformat(" ", "seconds"), reason),
+                )
+                rowid = conn.execute("SELECT rowid FROM dedupe_keys WHERE kind = ? AND key = ?", (kind, key)).fetchone()[0]
+            # Rows other processes added in between are left for the next catch up
+            if rowid == self._bloom.synced_rowid + 1:
+                self._bloom.synced_rowid = rowid
+            if is_new:
+                self._key_count += 1
+                self._grow_if_full()
+
+    def keys(self, kind: Kind, reason: str = "") -> KeySet:
+        '''
+        Returns a set-like view of `kind`, keys added through it are recorded with `reason`.
+        '''
+        return KeySet(self, kind, reason)
+
+    def counts(self) -> dict[str, int]:
+        with self.db.connection() as conn:
+            return {kind: total for kind, total in conn.execute("SELECT kind, COUNT(*) FROM dedupe_keys GROUP BY kind")}
+
+    def clear(self, kind: Kind) -> int:
+        '''
+        Forgets every key of `kind`, e.g. rejected jobs after changing the filters. Returns how many were removed.
+        '''
+        with self._lock:
+            with self.db.transaction() as conn:
+                removed = conn.execute("DELETE FROM dedupe_keys WHERE kind = ?", (kind,)).rowcount
+            # Bloom filters can't forget keys, so it's rebuilt from what's left
+            self._rebuild(self._bloom.capacity)
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._bloom.flush()
+            self._bloom.close()
+
+
+_index: DedupeIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_dedupe_index() -> DedupeIndex:
+    '''
+    Returns the process-wide dedupe index, kept in the history database, creating it on first use.
+    '''
+    global _index
+    from modules.history_store import get_history_store
+    with _index_lock:
+        if _index is None:
+            settings = get_app_config().settings
+            _index = DedupeIndex(get_history_store().db, settings.history_db_path + ".bloom", settings.dedupe_ttl_days)
+        return _index
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m modules.dedupe_index", description="Inspect or reset the applied/rejected/blacklisted index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Show how many keys of each kind are stored")
+    clear_parser = commands.add_parser("clear", help="Forget rejected jobs or blacklisted companies")
+    clear_parser.add_argument("--kind", choices=("rejected", "blacklisted_company"), default="rejected")
+    args = parser.parse_args(argv)
+
+    index = get_dedupe_index()
+    if args.command == "stats":
+        counts = index.counts()
+        for kind in KINDS:
+            print(f"{kind:<20} {counts.get(kind, 0)}")
+    else:
+        print(f"Removed {index.clear(args.kind)} {args.kind} entries.")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
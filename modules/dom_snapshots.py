@@ -0,0 +1,92 @@
+import os
+from functools import cache
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "javascript")
+
+
+@cache
+def load_script(name: str) -> str:
+    '''
+    Returns the source of `modules/javascript/<name>.js`, read from disk only once.
+    '''
+    with open(os.path.join(SCRIPTS_DIR, f"{name}.js"), encoding="utf-8") as file:
+        return file.read()
+
+
+def parse_card_subtitle(subtitle: str) -> tuple[str, str, str]:
+    '''
+    Splits a job card's subtitle, like "Company · City, State (Hybrid)", into `(company, work_location, work_style)`.
+    * `work_style` is empty if the subtitle doesn't show one, like "Company · City, State"
+    '''
+    index = subtitle.find(' · ')
+    if index == -1:
+        # Fallback if format is different
+        return subtitle.split('\n')[0], "", ""
+    company = subtitle[:index]
+    work_location = subtitle[index+3:]
+    opening, closing = work_location.rfind('('), work_location.rfind(')')
+    if opening == -1 or closing < opening:
+        return company, work_location.strip(), ""
+    return company, work_location[:opening].strip(), work_location[opening+1:closing]
+
+
+def _with_subtitle_parsed(card: dict) -> dict:
+    card["company"], card["work_location"], card["work_style"] = parse_card_subtitle(card.pop("subtitle"))
+    return card
+
+
+def extract_job_cards(driver: WebDriver, max_wait_per_card: float = 0.5, max_wait_total: float = 8) -> list[dict]:
+    '''
+    Reads every job card on the current search results page in a single WebDriver call.
+    * Returns a dict per card with `id`, `title`, `company`, `work_location`, `work_style` and `applied`
+    * `element` (the card) and `link` (its title link) are `WebElement`s, for clicking
+    * A card LinkedIn didn't render within `max_wait_per_card` seconds, or after `max_wait_total` seconds were spent waiting, has an empty `title`, see `read_job_card()`
+    '''
+    cards = driver.execute_async_script(load_script("extract_job_cards"), int(max_wait_per_card * 1000), int(max_wait_total * 1000))
+    if isinstance(cards, dict):
+        raise RuntimeError(f"Couldn't read job cards: {cards.get('error')}")
+    return [_with_subtitle_parsed(card) for card in cards]
+
+
+def unread_job_cards(driver: WebDriver) -> list[dict]:
+    '''
+    Returns every job card on the page with an empty `title`, for `read_job_card()` to read one by one.
+    * The fallback when `extract_job_cards()` fails, so one bad card doesn't lose the whole page
+    '''
+    return [{"element": element, "title": ""} for element in driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")]
+
+
+def read_job_card(element: WebElement) -> dict:
+    '''
+    Reads one job card element by element, the slow path for cards `extract_job_cards()` couldn't read.
+    * Returns the same dict as `extract_job_cards()`
+    '''
+    link = element.find_element(By.TAG_NAME, 'a')
+    title = link.text
+    try:
+        applied = element.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied"
+    except Exception:
+        applied = False
+    return _with_subtitle_parsed({
+        "element": element,
+        "link": link,
+        "id": element.get_dom_attribute('data-occludable-job-id'),
+        "title": title[:title.find("\n")] if "\n" in title else title,
+        "subtitle": element.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text,
+        "applied": applied,
+    })
+
+
+def extract_form_schema(driver: WebDriver, modal: WebElement) -> list[dict]:
+    '''
+    Serializes every question in the Easy Apply `modal` into a list of fields in a single WebDriver call.
+    * Each field has `kind` ("select", "radio", "text", "textarea" or "checkbox"), `label`, `value` (current answer) and `element`
+    * Selects have `options`, a list of option texts
+    * Radios have `options`, a list of dicts with `label`, `value`, `selected`, `element` (the input) and `label_element`
+    * Checkboxes have `option`, the text next to the box
+    '''
+    return driver.execute_script(load_script("extract_form_schema"), modal)
@@ -0,0 +1,198 @@
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import subprocess
+from time import perf_counter
+from typing import Callable
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+DRIVER_NAME = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+MANIFEST_NAME = "driver.json"
+
+
+def find_chrome() -> str | None:
+    '''
+    Finds the Chrome browser installation.
+    * Returns the path of the Chrome executable, or `None` if it isn't installed
+    '''
+    # Check PATH first
+    chrome_path = shutil.which('google-chrome') or shutil.which('chromium-browser') or shutil.which('chromium') or shutil.which('chrome')
+    if chrome_path:
+        return chrome_path
+
+    # Check common installation paths
+    common_paths = []
+
+    if sys.platform == 'win32':
+        # Windows paths
+        common_paths = [
+            os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
+            os.path.expandvars(r'%LocalAppData%\Google\Chrome\Application\chrome.exe'),
+            r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+        ]
+    elif sys.platform == 'darwin':
+        # macOS paths
+        common_paths = [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+            os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'),
+        ]
+    else:
+        # Linux paths
+        common_paths = [
+            '/usr/bin/google-chrome',
+            '/usr/bin/google-chrome-stable',
+            '/usr/bin/chromium',
+            '/usr/bin/chromium-browser',
+            '/snap/bin/chromium',
+        ]
+
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+def get_chrome_version(chrome_path: str) -> str | None:
+    '''
+    Returns the full version of the Chrome at `chrome_path`, like "120.0.6099.109", or `None` if it can't be determined.
+    '''
+    if sys.platform == 'win32':
+        # chrome.exe --version prints nothing on Windows, but the install has a folder named after the version
+        install_dir = os.path.dirname(chrome_path)
+        try:
+            versions = [name for name in os.listdir(install_dir) if VERSION_PATTERN.fullmatch(name)]
+        except OSError:
+            versions = []
+        if versions:
+            return max(versions, key=lambda name: tuple(int(part) for part in name.split('.')))
+        return None
+    try:
+        output = subprocess.run([chrome_path, '--version'], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DriverCache:
+    """
+    Keeps patched undetected-chromedriver binaries on disk, one per Chrome major version.
+    * The binary is downloaded and patched once, later runs (and offline runs) reuse it
+    * A manifest with the binary's checksum is written next to it, a cached binary that doesn't match is discarded
+    """
+
+    def __init__(self, cache_dir: str, log: Callable[[str], None] = print) -> None:
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.log = log
+
+    def _entry_dir(self, major: int) -> str:
+        return os.path.join(self.cache_dir, str(major))
+
+    def get(self, major: int) -> str | None:
+        '''
+        Returns the path of a verified cached driver for Chrome `major`, or `None` if there is none.
+        '''
+        entry = self._entry_dir(major)
+        driver_path = os.path.join(entry, DRIVER_NAME)
+        try:
+            with open(os.path.join(entry, MANIFEST_NAME)) as file:
+                manifest = json.load(file)
+            if manifest.get("major") == major and manifest.get("sha256") == _sha256(driver_path):
+                return driver_path
+        except (OSError, ValueError):
+            return None
+        self.log(f"Cached chromedriver for Chrome {major} failed verification, discarding it.")
+        self.invalidate(major)
+        return None
+
+    def put(self, major: int, source_path: str, chrome_version: str | None = None) -> str:
+        '''
+        Copies the patched driver at `source_path` into the cache for Chrome `major` and returns the cached path.
+        '''
+        entry = self._entry_dir(major)
+        os.makedirs(entry, exist_ok=True)
+        driver_path = os.path.join(entry, DRIVER_NAME)
+        temp_path = driver_path + ".tmp"
+        shutil.copy2(source_path, temp_path)
+        os.chmod(temp_path, 0o755)
+        os.replace(temp_path, driver_path)
+        manifest = {"major": major, "chrome_version": chrome_version, "sha256": _sha256(driver_path)}
+        with open(os.path.join(entry, MANIFEST_NAME), 'w') as file:
+            json.dump(manifest, file, indent=4)
+        return driver_path
+
+    def invalidate(self, major: int) -> None:
+        shutil.rmtree(self._entry_dir(major), ignore_errors=True)
+
+    def prepare(self, major: int, chrome_version: str | None = None) -> str:
+        '''
+        Returns a patched driver for Chrome `major`, downloading and patching it only if it isn't cached yet.
+        * Raises if it isn't cached and can't be downloaded, e.g. when offline
+        '''
+        cached = self.get(major)
+        if cached:
+            self.log(f"Using cached chromedriver for Chrome {major}: {cached}")
+            return cached
+        import undetected_chromedriver as uc
+        self.log(f"Downloading chromedriver for Chrome {major}, this is only needed once per Chrome version...")
+        patcher = uc.Patcher(version_main=major)
+        patcher.auto()
+        driver_path = self.put(major, patcher.executable_path, chrome_version)
+        try:
+            os.remove(patcher.executable_path)
+        except OSError:
+            pass
+        return driver_path
+
+
+def launch_undetected_chrome(make_options: Callable[[], object], cache_dir: str, log: Callable[[str], None] = print):
+    '''
+    Starts undetected Chrome with a cached, already patched chromedriver when possible.
+    * `make_options` returns a fresh `uc.ChromeOptions`, undetected-chromedriver doesn't allow reusing one for a retry
+    * Falls back to undetected-chromedriver's own download when the Chrome version is unknown or the cache can't be filled
+    * Logs how long each startup step took
+    '''
+    import undetected_chromedriver as uc
+    started = perf_counter()
+    chrome_path = find_chrome()
+    chrome_version = get_chrome_version(chrome_path) if chrome_path else None
+    major = int(chrome_version.split('.')[0]) if chrome_version else None
+    log(f"Startup: found Chrome {chrome_version or 'of unknown version'} in {perf_counter() - started:.2f}s")
+
+    driver_path = None
+    if major:
+        step = perf_counter()
+        try:
+            driver_path = DriverCache(cache_dir, log).prepare(major, chrome_version)
+            log(f"Startup: chromedriver ready in {perf_counter() - step:.2f}s")
+        except Exception as e:
+            log(f"Couldn't prepare a cached chromedriver, falling back to a fresh download. {e}")
+
+    step = perf_counter()
+    if driver_path:
+        try:
+            driver = uc.Chrome(options=make_options(), driver_executable_path=driver_path, browser_executable_path=chrome_path, version_main=major)
+        except Exception as e:
+            # A stale or broken cached driver shouldn't stop the bot, drop it and let uc download one
+            log(f"Cached chromedriver failed to start Chrome, discarding it. {e}")
+            DriverCache(cache_dir, log).invalidate(major)
+            driver = uc.Chrome(options=make_options())
+    else:
+        log("Downloading Chrome Driver... This may take some time.")
+        driver = uc.Chrome(options=make_options())
+    log(f"Startup: browser launched in {perf_counter() - step:.2f}s (total {perf_counter() - started:.2f}s)")
+    return driver
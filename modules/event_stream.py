@@ -0,0 +1,115 @@
+import json
+import queue
+import threading
+from typing import Callable, Iterator
+
+# A source is polled by the hub and returns the events that happened since its last call
+EventSource = Callable[[], list[tuple[str, dict]]]
+
+# Put in a dropped subscriber's queue to end its stream
+_DROPPED = object()
+
+
+class EventHub:
+    """
+    Pushes dashboard events (new log lines, bot status, interaction prompts) to every
+    connected Server-Sent Events client.
+    * A single poller thread checks the registered sources, however many dashboards are open
+    * The poller only runs while at least one client is connected, so idle servers do no work
+    * Other code can also `publish()` directly, e.g. when something changes in-process
+    """
+
+    def __init__(self, poll_interval: float = 0.5, keepalive: float = 15.0, max_queue: int = 1000) -> None:
+        self.poll_interval = poll_interval
+        self.keepalive = keepalive
+        self.max_queue = max_queue
+        self._sources: list[tuple[EventSource, Callable[[], None] | None]] = []
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._poller: threading.Thread | None = None
+
+    def add_source(self, source: EventSource, reset: Callable[[], None] | None = None) -> None:
+        """Registers `source` to be polled. `reset` is called whenever the poller (re)starts, to drop stale state."""
+        self._sources.append((source, reset))
+
+    def subscribe(self) -> queue.Queue:
+        subscriber = queue.Queue(self.max_queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._poller is None or not self._poller.is_alive():
+                self._poller = threading.Thread(target=self._poll, name="event-hub", daemon=True)
+                self._poller.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event: str, data: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event, data))
+            except queue.Full:
+                # A stalled client shouldn't hold everyone else back, it will resync on reconnect
+                self.drop(subscriber)
+
+    def drop(self, subscriber: queue.Queue) -> None:
+        """Unsubscribes `subscriber` and ends its stream, so the browser reconnects and gets a fresh snapshot."""
+        self.unsubscribe(subscriber)
+        while True:
+            # Its events are stale now anyway, make room for the marker
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                subscriber.put_nowait(_DROPPED)
+                return
+            except queue.Full:
+                continue
+
+    def poll_now(self) -> None:
+        """Runs the sources right away instead of waiting for the next interval."""
+        self._wake.set()
+
+    def stream(self, subscriber: queue.Queue, initial: list[tuple[str, dict]] = ()) -> Iterator[str]:
+        """Yields `subscriber`'s events formatted for a `text/event-stream` response, until the client disconnects or is dropped."""
+        try:
+            for event, data in initial:
+                yield format_event(event, data)
+            while True:
+                try:
+                    item = subscriber.get(timeout=self.keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if item is _DROPPED:
+                    return
+                yield format_event(*item)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def _poll(self) -> None:
+        for _, reset in self._sources:
+            if reset:
+                reset()
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._poller = None
+                    return
+            for source, _ in self._sources:
+                try:
+                    for event, data in source():
+                        self.publish(event, data)
+                except Exception as e:
+                    self.publish("error", {"error": str(e)})
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
+def format_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -16,19 +16,30 @@ version:    24.12.29.12.30
 
 import os
 import sys
+import glob
+import gzip
 import json
+import queue
+import shutil
+import atexit
 import pathlib
+import threading
+import importlib.util
 
-from time import sleep
+from time import sleep, monotonic
 from random import randint
 from datetime import datetime, timedelta
-from pyautogui import alert
 from pprint import pprint
 
-from modules.config_loader import get_config
-config = get_config()
-settings = config.get('settings', {})
-logs_folder_path = settings.get('logs_folder_path', "logs/")
+from modules.config_model import get_app_config
+config = get_app_config()
+settings = config.settings
+logs_folder_path = settings.logs_folder_path
+log_flush_interval = settings.log_flush_interval
+log_max_bytes = settings.log_max_bytes
+log_max_age_hours = settings.log_max_age_hours
+log_backup_count = settings.log_backup_count
+log_compress = settings.log_compress
 
 
 #### Common functions ####
@@ -119,15 +130,164 @@ def get_log_path():
 __logs_file_path = get_log_path()
 
 
+class BufferedLogWriter:
+    '''
+    Appends log text to a file from a background thread.
+    * `write()` only puts text on a queue, so callers never wait on disk
+    * The writer thread keeps the file open and writes queued text in batches, at least every `flush_interval` seconds
+    * Everything queued is written out on `flush()`, `close()` and at interpreter exit
+    * The file is rotated once it's bigger than `max_bytes` or older than `max_age_hours` (`0` disables either),
+      rotated segments are renamed to `<name>-<timestamp><ext>`, gzipped if `compress = True`,
+      and only the newest `backup_count` of them are kept
+    '''
+    _STOP = object()
+    max_batch_chars = 256 * 1024
+
+    def __init__(self, path: str, flush_interval: float = 0.5, max_bytes: int = 0, max_age_hours: float = 0,
+                 backup_count: int = 5, compress: bool = True) -> None:
+        self.path = path
+        self.flush_interval = max(0.01, float(flush_interval))
+        self.max_bytes = int(max_bytes or 0)
+        self.max_age_seconds = float(max_age_hours or 0) * 3600
+        self.backup_count = max(0, int(backup_count))
+        self.compress = compress
+        self._segment_started = 0.0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put(text)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        '''
+        Blocks until everything written so far is on disk (or `timeout` seconds pass).
+        '''
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        file = None
+        pending: list[str] = []
+        pending_chars = 0
+        deadline = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - monotonic()) if pending else None)
+            except queue.Empty:
+                item = None
+            if isinstance(item, str):
+                if not pending:
+                    deadline = monotonic() + self.flush_interval
+                pending.append(item)
+                pending_chars += len(item)
+                if pending_chars < self.max_batch_chars and monotonic() < deadline:
+                    continue
+            if pending:
+                try:
+                    text = "".join(pending)
+                    if file is None:
+                        file = self._open()
+                    elif self._should_rotate(file, len(text.encode("utf-8"))):
+                        file.close()
+                        file = None
+                        self._rotate()
+                        file = self._open()
+                    file.write(text)
+                    file.flush()
+                except Exception as e:
+                    print(f'Failed to write {len(pending)} messages to "{self.path}"! Is it open in another program?', e)
+                    if file is not None:
+                        try: file.close()
+                        except Exception: pass
+                    file = None
+                pending, pending_chars = [], 0
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                if file is not None:
+                    file.close()
+                return
+
+    def _open(self):
+        '''
+        Opens the log for appending, rotating first if a previous run left it too old or too big.
+        '''
+        if os.path.exists(self.path):
+            stat = os.stat(self.path)
+            too_old = self.max_age_seconds and datetime.now().timestamp() - stat.st_mtime >= self.max_age_seconds
+            too_big = self.max_bytes and stat.st_size >= self.max_bytes
+            if stat.st_size and (too_old or too_big):
+                self._rotate()
+        self._segment_started = datetime.now().timestamp()
+        return open(self.path, 'a', encoding="utf-8")
+
+    def _should_rotate(self, file, incoming_bytes: int) -> bool:
+        # `tell()` of a UTF-8 file opened for appending is its size in bytes, so both sides count bytes
+        size = file.tell()
+        if not size:
+            return False
+        if self.max_bytes and size + incoming_bytes > self.max_bytes:
+            return True
+        return bool(self.max_age_seconds and datetime.now().timestamp() - self._segment_started >= self.max_age_seconds)
+
+    def _rotate(self) -> None:
+        try:
+            root, ext = os.path.splitext(self.path)
+            archive = f"{root}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{ext}"
+            suffix = 1
+            while os.path.exists(archive) or os.path.exists(archive + ".gz"):
+                archive = f"{root}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{suffix}{ext}"
+                suffix += 1
+            os.replace(self.path, archive)
+            if self.compress:
+                with open(archive, 'rb') as source, gzip.open(archive + ".gz", 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(archive)
+            archives = sorted(glob.glob(glob.escape(root) + "-*" + ext) + glob.glob(glob.escape(root) + "-*" + ext + ".gz"), key=os.path.getmtime)
+            for old in archives[:max(0, len(archives) - self.backup_count)]:
+                os.remove(old)
+        except Exception as e:
+            print(f'Failed to rotate "{self.path}"!', e)
+
+
+__log_writer = BufferedLogWriter(__logs_file_path, log_flush_interval, log_max_bytes, log_max_age_hours, log_backup_count, log_compress)
+
+
+def flush_logs() -> None:
+    '''
+    Function to wait until every message passed to `print_lg` so far is written to log.txt
+    '''
+    __log_writer.flush()
+
+
 def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Log file writes are buffered and done by a background thread, `flush` only applies to the console
     '''
     try:
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            __log_writer.write(str(message) + end)
     except Exception as e:
         trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
         # alert(f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}", "Failed Logging")
@@ -153,6 +313,22 @@ def buffer(speed: int=0) -> None:
         return sleep(randint(10,18)*0.1)
     else:
         return sleep(randint(18,round(speed)*10)*0.1)
+
+
+def buffer_floor(speed: int=0) -> float:
+    '''
+    Function to get the shortest wait `buffer(speed)` can make, in seconds.
+    * Used as the minimum gap before waiting on a page condition instead of a random sleep
+    '''
+    # Same comparisons as `buffer()`
+    if speed<=0:
+        return 0
+    elif speed <= 1:
+        return 0.6
+    elif speed <= 2:
+        return 1.0
+    else:
+        return 1.8
     
 
 def manual_login_retry(is_logged_in: callable, limit: int = 2) -> None:
@@ -272,4 +448,24 @@ def truncate_for_csv(data, max_length: int = 131000, suffix: str = "...[TRUNCATE
         truncated = str_data[:max_length - len(suffix)] + suffix
         return truncated
     except Exception as e:
-        return f"[ERROR CONVERTING DATA: {e}]"
\ No newline at end of file
+        return f"[ERROR CONVERTING DATA: {e}]"
+
+
+def lazy_import(name: str):
+    '''
+    Function to import a module without running it until one of its attributes is used.
+    * Takes in `name` of type `str` - the module to import, like "pyautogui"
+    * Returns the module, it's only actually loaded on first attribute access
+    * Raises `ModuleNotFoundError` if the module isn't installed
+    '''
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,417 @@
+'''
+Application history storage.
+
+The bot used to append every applied/failed job to two CSV files and re-read them in full
+whenever it needed to look something up. This module keeps the same records in an embedded
+SQLite database instead (WAL mode, indexed on Job ID, company and date), behind a small
+`HistoryStore` interface so other backends can be plugged in via `settings.history_backend`.
+
+Records are exchanged as dicts keyed by the original CSV column names ("Job ID", "Title", ...),
+which keeps `submitted_jobs()`/`failed_job()` and the CSV import/export trivial.
+
+Command line:
+    python -m modules.history_store import [--applied CSV] [--failed CSV]
+    python -m modules.history_store export [--table applied|failed] [--out CSV]
+'''
+
+import base64
+import csv
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Iterator, Literal
+
+from modules.config_model import get_app_config
+from modules.database import SqliteDatabase
+
+# CSV column name -> database column name, in CSV order
+APPLIED_COLUMNS = {
+    'Job ID': 'job_id', 'Title': 'title', 'Company': 'company', 'Work Location': 'work_location',
+    'Work Style': 'work_style', 'About Job': 'about_job', 'Experience required': 'experience_required',
+    'Skills required': 'skills_required', 'HR Name': 'hr_name', 'HR Link': 'hr_link', 'Resume': 'resume',
+    'Re-posted': 'reposted', 'Date Posted': 'date_posted', 'Date Applied': 'date_applied', 'Job Link': 'job_link',
+    'External Job link': 'external_job_link', 'Questions Found': 'questions_found', 'Connect Request': 'connect_request',
+}
+FAILED_COLUMNS = {
+    'Job ID': 'job_id', 'Job Link': 'job_link', 'Resume Tried': 'resume_tried', 'Date listed': 'date_listed',
+    'Date Tried': 'date_tried', 'Assumed Reason': 'assumed_reason', 'Stack Trace': 'stack_trace',
+    'External Job link': 'external_job_link', 'Screenshot Name': 'screenshot_name',
+}
+TABLES = {"applied": ("applied_jobs", APPLIED_COLUMNS), "failed": ("failed_jobs", FAILED_COLUMNS)}
+
+Table = Literal["applied", "failed"]
+
+# Sort keys accepted by `query_applied()` -> indexed SQL expression
+SORT_KEYS = {
+    "id": "id",
+    "date_applied": "date_applied",
+    "company": "company COLLATE NOCASE",
+    "job_id": "job_id",
+}
+MAX_PAGE_SIZE = 1000
+
+
+class HistoryStore(ABC):
+    '''
+    Interface every history backend implements. Records are dicts keyed by CSV column names.
+    '''
+
+    @abstractmethod
+    def add_applied(self, record: dict) -> None:
+        ...
+
+    @abstractmethod
+    def add_failed(self, record: dict) -> None:
+        ...
+
+    @abstractmethod
+    def add_many(self, table: Table, records: list[dict]) -> int:
+        ...
+
+    @abstractmethod
+    def applied_job_ids(self) -> set[str]:
+        ...
+
+    @abstractmethod
+    def list_applied(self) -> list[dict]:
+        ...
+
+    @abstractmethod
+    def query_applied(self, limit: int = 100, cursor: str | None = None, company: str | None = None, title: str | None = None,
+                      date_from: str | None = None, date_to: str | None = None, sort: str = "id", order: str = "asc") -> tuple[list[dict], str | None, int]:
+        ...
+
+    @abstractmethod
+    def update_date_applied(self, job_id: str, date_applied: str) -> bool:
+        ...
+
+    @abstractmethod
+    def iter_records(self, table: Table) -> Iterator[dict]:
+        ...
+
+    @abstractmethod
+    def count(self, table: Table) -> int:
+        ...
+
+    @abstractmethod
+    def get_meta(self, key: str) -> str | None:
+        ...
+
+    @abstractmethod
+    def set_meta(self, key: str, value: str) -> None:
+        ...
+
+    @abstractmethod
+    def import_legacy_csvs(self, applied_path: str, failed_path: str) -> bool:
+        '''
+        Imports the history CSVs the first time it's called on this store, returns `False` if they were already imported.
+        * Must be atomic, so two processes starting at once (bot and dashboard) can't both import them
+        '''
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteHistoryStore(HistoryStore):
+    '''
+    `HistoryStore` backed by an SQLite file. Safe to share between threads and processes.
+    '''
+
+    def __init__(self, path: str) -> None:
+        self.db = SqliteDatabase(path)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self.db.transaction() as conn:
+            for table, columns in TABLES.values():
+                column_defs = ", ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in columns.values())
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, {column_defs})")
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_job_id ON {table} (job_id)")
+            conn.execute("DROP INDEX IF EXISTS idx_applied_jobs_company")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applied_jobs_company_nocase ON applied_jobs (company COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applied_jobs_date_applied ON applied_jobs (date_applied)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_failed_jobs_date_tried ON failed_jobs (date_tried)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            # Exact store behind `modules.dedupe_index`, applied jobs are added here as they're written
+            conn.execute("CREATE TABLE IF NOT EXISTS dedupe_keys (kind TEXT NOT NULL, key TEXT NOT NULL, added TEXT NOT NULL, reason TEXT NOT NULL DEFAULT '', UNIQUE (kind, key))")
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'dedupe_seeded'").fetchone() is None:
+                conn.execute("INSERT OR IGNORE INTO dedupe_keys (kind, key, added) SELECT 'applied', job_id, MIN(date_applied) FROM applied_jobs GROUP BY job_id")
+                conn.execute("INSERT INTO meta (key, value) VALUES ('dedupe_seeded', '1')")
+            # Row counts kept up to date by triggers, so unfiltered totals don't need a table scan
+            conn.execute("CREATE TABLE IF NOT EXISTS row_counts (name TEXT PRIMARY KEY, total INTEGER NOT NULL)")
+            for table, _ in TABLES.values():
+                conn.execute(f"INSERT OR IGNORE INTO row_counts (name, total) SELECT '{table}', COUNT(*) FROM {table}")
+                conn.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_count_insert AFTER INSERT ON {table} BEGIN UPDATE row_counts SET total = total + 1 WHERE name = '{table}'; END")
+                conn.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_count_delete AFTER DELETE ON {table} BEGIN UPDATE row_counts SET total = total - 1 WHERE name = '{table}'; END")
+
+    @staticmethod
+    def _insert_sql(table: Table) -> tuple[str, dict]:
+        name, columns = TABLES[table]
+        placeholders = ", ".join("?" for _ in columns)
+        return f"INSERT INTO {name} ({', '.join(columns.values())}) VALUES ({placeholders})", columns
+
+    @staticmethod
+    def _values(record: dict, columns: dict) -> list[str]:
+        return ["" if record.get(header) is None else str(record.get(header)) for header in columns]
+
+    def add_applied(self, record: dict) -> None:
+        self.add_many("applied", [record])
+
+    def add_failed(self, record: dict) -> None:
+        self.add_many("failed", [record])
+
+    def add_many(self, table: Table, records: list[dict]) -> int:
+        with self.db.transaction() as conn:
+            return self._insert_many(conn, table, records)
+
+    def _insert_many(self, conn, table: Table, records: list[dict]) -> int:
+        sql, columns = self._insert_sql(table)
+        conn.executemany(sql, (self._values(record, columns) for record in records))
+        if table == "applied":
+            now = datetime.now().isoformat(" ", "seconds")
+            conn.executemany(
+                "INSERT OR IGNORE INTO dedupe_keys (kind, key, added) VALUES ('applied', ?, ?)",
+                ((str(record.get('Job ID') or ''), now) for record in records),
+            )
+        return len(records)
+
+    def applied_job_ids(self) -> set[str]:
+        with self.db.connection() as conn:
+            return {row[0] for row in conn.execute("SELECT DISTINCT job_id FROM applied_jobs")}
+
+    def list_applied(self) -> list[dict]:
+        return list(self.iter_records("applied"))
+
+    def query_applied(self, limit: int = 100, cursor: str | None = None, company: str | None = None, title: str | None = None,
+                      date_from: str | None = None, date_to: str | None = None, sort: str = "id", order: str = "asc") -> tuple[list[dict], str | None, int]:
+        '''
+        Returns one page of applied jobs as `(records, next_cursor, total)`.
+        * `cursor` is the opaque `next_cursor` of the previous page (keyset pagination, so deep pages cost the same as the first)
+        * `company` matches exactly (case-insensitive), `title` is a substring match, `date_from`/`date_to` bound "Date Applied" (inclusive)
+        * `total` counts every record matching the filters
+        * Raises `ValueError` for invalid arguments
+        '''
+        if sort not in SORT_KEYS:
+            raise ValueError(f'Invalid sort "{sort}"! Use one of: {", ".join(SORT_KEYS)}')
+        if order not in ("asc", "desc"):
+            raise ValueError('Invalid order! Use "asc" or "desc"')
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        filters, params = [], []
+        if company:
+            filters.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if title:
+            filters.append("title LIKE ? ESCAPE '\\'")
+            params.append("%" + title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        if date_from or date_to:
+            filters.append("date_applied GLOB '[0-9]*'")  # Skips "Pending" and other non-dates
+        if date_from:
+            filters.append("date_applied >= ?")
+            params.append(_parse_date(date_from, "date_from").strftime('%Y-%m-%d %H:%M:%S'))
+        if date_to:
+            end = _parse_date(date_to, "date_to")
+            filters.append("date_applied < ?" if len(date_to) == 10 else "date_applied <= ?")
+            params.append((end + timedelta(days=1) if len(date_to) == 10 else end).strftime('%Y-%m-%d %H:%M:%S'))
+
+        sort_expr = SORT_KEYS[sort]
+        page_filters, page_params = list(filters), list(params)
+        if cursor:
+            after_value, after_id = _decode_cursor(cursor)
+            comparison = ">" if order == "asc" else "<"
+            if sort == "id":
+                page_filters.append(f"id {comparison} ?")
+                page_params.append(after_id)
+            else:
+                # The single-column bound lets SQLite seek the index; the row value breaks ties on id
+                page_filters.append(f"{sort_expr} {comparison}= ? AND ({sort_expr}, id) {comparison} (?, ?)")
+                page_params += [after_value, after_value, after_id]
+
+        columns = ", ".join(APPLIED_COLUMNS.values())
+        where = f" WHERE {' AND '.join(page_filters)}" if page_filters else ""
+        order_by = f"{sort_expr} {order.upper()}" + ("" if sort == "id" else f", id {order.upper()}")
+        with self.db.connection() as conn:
+            rows = conn.execute(f"SELECT id, {columns} FROM applied_jobs{where} ORDER BY {order_by} LIMIT ?", page_params + [limit + 1]).fetchall()
+            if filters:
+                total = conn.execute(f"SELECT COUNT(*) FROM applied_jobs WHERE {' AND '.join(filters)}", params).fetchone()[0]
+            else:
+                total = conn.execute("SELECT total FROM row_counts WHERE name = 'applied_jobs'").fetchone()[0]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(last[sort], last["id"])
+        records = [{header: row[column] for header, column in APPLIED_COLUMNS.items()} for row in rows]
+        return records, next_cursor, total
+
+    def update_date_applied(self, job_id: str, date_applied: str) -> bool:
+        # Index lookup on job_id: only the matching row(s) and their index entries are rewritten.
+        # The write lock is held just for this statement, so it interleaves safely with the bot's inserts.
+        with self.db.transaction() as conn:
+            cursor = conn.execute("UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?", (date_applied, job_id))
+        return cursor.rowcount > 0
+
+    def iter_records(self, table: Table) -> Iterator[dict]:
+        name, columns = TABLES[table]
+        with self.db.connection() as conn:
+            for row in conn.execute(f"SELECT {', '.join(columns.values())} FROM {name} ORDER BY id"):
+                yield {header: row[column] for header, column in columns.items()}
+
+    def count(self, table: Table) -> int:
+        name, _ = TABLES[table]
+        # Kept up to date by triggers, see `_create_schema()`
+        with self.db.connection() as conn:
+            return conn.execute("SELECT total FROM row_counts WHERE name = ?", (name,)).fetchone()[0]
+
+    def get_meta(self, key: str) -> str | None:
+        with self.db.connection() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self.db.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def import_legacy_csvs(self, applied_path: str, failed_path: str) -> bool:
+        # The meta row is checked and written under the same write lock as the inserts
+        with self.db.transaction() as conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'csv_imported'").fetchone() is not None:
+                return False
+            for table, path in (("applied", applied_path), ("failed", failed_path)):
+                for batch in read_csv_batches(path):
+                    self._insert_many(conn, table, batch)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('csv_imported', '1')")
+        return True
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def _parse_date(value: str, name: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a date like "2024-12-31" or "2024-12-31 18:30:00"')
+
+
+def _encode_cursor(value, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([value, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return value, int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+# Backends selectable through `settings.history_backend`
+BACKENDS: dict[str, type[HistoryStore]] = {
+    "sqlite": SqliteHistoryStore,
+}
+
+_store: HistoryStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_history_store(import_legacy: bool = True) -> HistoryStore:
+    '''
+    Returns the process-wide history store configured in `config.json`, creating it on first use.
+    * If `import_legacy = True`, existing history CSVs are imported once, so upgrading keeps old history.
+    '''
+    global _store
+    with _store_lock:
+        if _store is None:
+            settings = get_app_config().settings
+            backend = settings.history_backend
+            if backend not in BACKENDS:
+                raise ValueError(f'Unknown history backend "{backend}"! Available: {", ".join(BACKENDS)}')
+            _store = BACKENDS[backend](settings.history_db_path)
+            if import_legacy:
+                _store.import_legacy_csvs(settings.file_name, settings.failed_file_name)
+        return _store
+
+
+def import_csv(store: HistoryStore, table: Table, path: str, batch_size: int = 5000) -> int:
+    '''
+    Imports rows of a history CSV into `table` of `store`. Returns number of rows imported.
+    * Returns `0` if the CSV doesn't exist
+    '''
+    imported = 0
+    for batch in read_csv_batches(path, batch_size):
+        imported += store.add_many(table, batch)
+    return imported
+
+
+def read_csv_batches(path: str, batch_size: int = 5000) -> Iterator[list[dict]]:
+    '''
+    Yields the rows of a history CSV in lists of up to `batch_size`, nothing if the CSV doesn't exist.
+    '''
+    if not os.path.exists(path):
+        return
+    csv.field_size_limit(1000000)
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        batch = []
+        for row in csv.DictReader(file):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def export_csv(store: HistoryStore, table: Table, path: str) -> int:
+    '''
+    Writes every record of `table` to a CSV at `path` with the original column headers. Returns number of rows written.
+    '''
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    exported = 0
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(TABLES[table][1]))
+        writer.writeheader()
+        for record in store.iter_records(table):
+            writer.writerow(record)
+            exported += 1
+    return exported
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+    settings = get_app_config().settings
+    applied_csv = settings.file_name
+    failed_csv = settings.failed_file_name
+
+    parser = argparse.ArgumentParser(prog="python -m modules.history_store", description="Import or export the application history.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="Import history CSVs into the history store")
+    import_parser.add_argument("--applied", default=applied_csv, help=f"Applied jobs CSV (default: {applied_csv})")
+    import_parser.add_argument("--failed", default=failed_csv, help=f"Failed jobs CSV (default: {failed_csv})")
+    import_parser.add_argument("--force", action="store_true", help="Import even if history was already imported (may duplicate rows)")
+    export_parser = commands.add_parser("export", help="Export the history store to CSV")
+    export_parser.add_argument("--table", choices=list(TABLES), default="applied", help="Which history to export (default: applied)")
+    export_parser.add_argument("--out", help="Output CSV path (default: the configured CSV path with an '_export' suffix)")
+    args = parser.parse_args(argv)
+
+    store = get_history_store(import_legacy=False)
+    if args.command == "import":
+        if store.get_meta("csv_imported") is not None and not args.force:
+            parser.exit(1, "History CSVs were already imported! Use --force to import again.\n")
+        print(f"Imported {import_csv(store, 'applied', args.applied)} applied jobs from '{args.applied}'")
+        print(f"Imported {import_csv(store, 'failed', args.failed)} failed jobs from '{args.failed}'")
+        store.set_meta("csv_imported", "1")
+    else:
+        out = args.out or os.path.splitext(applied_csv if args.table == "applied" else failed_csv)[0] + "_export.csv"
+        print(f"Exported {export_csv(store, args.table, out)} {args.table} jobs to '{out}'")
+
+
+if __name__ == "__main__":
+    main()
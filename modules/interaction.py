@@ -0,0 +1,239 @@
+import os
+import json
+import threading
+from time import sleep, monotonic
+from uuid import uuid4
+from typing import Callable
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client, Connection
+
+# The supervisor passes the channel to the bot through these environment variables
+ADDRESS_ENV = "AUTOAPPLY_IPC_ADDRESS"
+AUTHKEY_ENV = "AUTOAPPLY_IPC_AUTHKEY"
+
+INTERACTION_FILE = "interaction.json"
+
+IDLE = {"status": "idle"}
+
+
+class InteractionServer:
+    """
+    Supervisor (dashboard) side of the channel the bot uses to ask the user for input.
+    * Listens on a random localhost port, only clients presenting the per-run `authkey` are accepted
+    * Every prompt carries an `id`, and the answer is sent straight back over the same connection
+    * `on_change` is called with the new status whenever a prompt is raised, answered or abandoned
+    """
+
+    def __init__(self, on_change: Callable[[dict], None] | None = None) -> None:
+        self.on_change = on_change
+        self.authkey = os.urandom(32)
+        self._listener: Listener | None = None
+        self._conn: Connection | None = None
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+
+    def start(self) -> dict[str, str]:
+        '''
+        Starts listening if not already listening.
+        * Returns the environment variables a child process needs to connect
+        '''
+        with self._lock:
+            if self._listener is None:
+                self._listener = Listener(("127.0.0.1", 0), authkey=self.authkey)
+                threading.Thread(target=self._accept, args=(self._listener,), name="interaction-accept", daemon=True).start()
+            host, port = self._listener.address
+        return {ADDRESS_ENV: f"{host}:{port}", AUTHKEY_ENV: self.authkey.hex()}
+
+    def _accept(self, listener: Listener) -> None:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError):
+                continue # Failed handshake, e.g. a wrong authkey or a client that hung up
+            except OSError:
+                if self._listener is not listener:
+                    break # Stopped, accept() fails for good now
+                continue # Connection reset during the handshake
+            with self._lock:
+                old, self._conn = self._conn, conn
+                self._pending.clear()
+            if old:
+                old.close()
+            threading.Thread(target=self._serve, args=(conn,), name="interaction-conn", daemon=True).start()
+
+    def _serve(self, conn: Connection) -> None:
+        try:
+            while True:
+                message = conn.recv()
+                if message.get("type") == "ask":
+                    prompt = {"status": "waiting", "id": message["id"], "prompt": message.get("prompt", "")}
+                    with self._lock:
+                        self._pending[message["id"]] = prompt
+                    self._notify()
+                elif message.get("type") == "cancel":
+                    with self._lock:
+                        self._pending.pop(message["id"], None)
+                    self._notify()
+        except (EOFError, OSError):
+            pass # Bot exited or reconnected
+        finally:
+            with self._lock:
+                if self._conn is conn:
+                    self._conn = None
+                    self._pending.clear()
+            conn.close()
+            self._notify()
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+        if self.on_change:
+            self.on_change(self.status())
+
+    def status(self) -> dict:
+        '''
+        Returns the oldest unanswered prompt as `{"status": "waiting", "id", "prompt"}`, or `{"status": "idle"}`
+        '''
+        with self._lock:
+            for prompt in self._pending.values():
+                return dict(prompt)
+        return dict(IDLE)
+
+    def wait_for_prompt(self, timeout: float, after_id: str | None = None) -> dict | None:
+        '''
+        Blocks until a prompt other than `after_id` is waiting and returns it, or returns `None` after `timeout` seconds.
+        '''
+        deadline = monotonic() + timeout
+        with self._changed:
+            while True:
+                for prompt in self._pending.values():
+                    if prompt["id"] != after_id:
+                        return dict(prompt)
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def respond(self, response: str, request_id: str | None = None) -> bool:
+        '''
+        Sends `response` to the bot for prompt `request_id`, or for the oldest pending prompt if not given.
+        * Returns `False` if there is no such prompt waiting
+        '''
+        with self._lock:
+            if request_id is None:
+                request_id = next(iter(self._pending), None)
+            if request_id not in self._pending or self._conn is None:
+                return False
+            try:
+                self._conn.send({"type": "answer", "id": request_id, "response": response})
+            except OSError:
+                return False
+            del self._pending[request_id]
+        self._notify()
+        return True
+
+    def stop(self) -> None:
+        '''
+        Stops listening and drops the bot's connection, pending prompts are abandoned.
+        '''
+        with self._lock:
+            listener, self._listener = self._listener, None
+            conn, self._conn = self._conn, None
+            self._pending.clear()
+        if listener:
+            listener.close()
+        if conn:
+            conn.close()
+        self._notify()
+
+
+class InteractionClient:
+    """
+    Bot side of the channel, see `InteractionServer`.
+    """
+
+    def __init__(self, address: str, authkey: bytes) -> None:
+        host, port = address.rsplit(":", 1)
+        self._conn = Client((host, int(port)), authkey=authkey)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "InteractionClient | None":
+        '''
+        Connects using the environment variables set by the supervisor.
+        * Returns `None` if the bot wasn't started by a supervisor or it can't be reached
+        '''
+        address, authkey = os.environ.get(ADDRESS_ENV), os.environ.get(AUTHKEY_ENV)
+        if not address or not authkey:
+            return None
+        try:
+            return cls(address, bytes.fromhex(authkey))
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def ask(self, prompt: str, timeout: float | None = None) -> str:
+        '''
+        Raises `prompt` in the dashboard and blocks until it's answered.
+        * Raises `TimeoutError` if `timeout` seconds pass without an answer (`None` waits forever)
+        * Raises `EOFError` if the supervisor goes away
+        '''
+        request_id = uuid4().hex
+        with self._lock:
+            self._conn.send({"type": "ask", "id": request_id, "prompt": prompt})
+            deadline = None if timeout is None else monotonic() + timeout
+            while True:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._conn.send({"type": "cancel", "id": request_id})
+                    raise TimeoutError(f"No response to prompt within {timeout} seconds")
+                if not self._conn.poll(remaining):
+                    continue
+                message = self._conn.recv()
+                if message.get("type") == "answer" and message.get("id") == request_id:
+                    return message.get("response", "")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def read_interaction_file(path: str = INTERACTION_FILE) -> dict:
+    '''
+    Reads the fallback interaction file, returns `{"status": "idle"}` if it's missing or unreadable.
+    '''
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return dict(IDLE)
+
+
+def write_interaction_file(data: dict, path: str = INTERACTION_FILE) -> None:
+    '''
+    Replaces the fallback interaction file atomically, so readers never see a half written file.
+    '''
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+def ask_via_file(prompt: str, timeout: float | None = None, poll_interval: float = 1.0, path: str = INTERACTION_FILE) -> str:
+    '''
+    Fallback for `InteractionClient.ask()` when no supervisor channel is available, e.g. when the bot was started by hand.
+    '''
+    request_id = uuid4().hex
+    write_interaction_file({"status": "waiting", "id": request_id, "prompt": prompt}, path)
+    deadline = None if timeout is None else monotonic() + timeout
+    while deadline is None or monotonic() < deadline:
+        sleep(poll_interval)
+        data = read_interaction_file(path)
+        if data.get("status") == "responded" and data.get("id", request_id) == request_id:
+            write_interaction_file(IDLE, path)
+            return data.get("response", "")
+    write_interaction_file(IDLE, path)
+    raise TimeoutError(f"No response to prompt within {timeout} seconds")
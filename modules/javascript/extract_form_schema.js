@@ -0,0 +1,83 @@
+// Serializes every question of an Easy Apply form in one WebDriver call.
+// Run with driver.execute_script(script, modal).
+// Returns a list of fields, each with `kind` ("select", "radio", "text", "textarea" or "checkbox"), `label`,
+// `value` and `element` (the input to fill or click), plus `options` for selects and radios.
+// Question kinds are checked in the same order the bot used to probe them, so a question counts only once.
+
+const modal = arguments[0];
+
+function text(element) {
+    // Collapsed like XPath's normalize-space(), so labels compare equal however the markup wraps them
+    return element ? element.innerText.replace(/\s+/g, ' ').trim() : '';
+}
+
+function radioField(fieldset) {
+    const title = fieldset.querySelector('span[data-test-form-builder-radio-button-form-component__title]');
+    const label = title ? (title.querySelector('.visually-hidden') || title) : null;
+    const options = Array.from(fieldset.querySelectorAll('input')).map(input => {
+        const optionLabel = input.id ? fieldset.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+        return {
+            label: optionLabel ? text(optionLabel) : 'Unknown',
+            value: input.getAttribute('value'),
+            selected: input.checked,
+            element: input,
+            label_element: optionLabel,
+        };
+    });
+    const selected = options.find(option => option.selected);
+    return {
+        kind: 'radio',
+        label: label ? text(label) : 'Unknown',
+        options: options,
+        value: selected ? selected.label : null,
+        element: fieldset,
+    };
+}
+
+function describeQuestion(question) {
+    const select = question.querySelector('select');
+    if (select) {
+        const label = question.querySelector('label');
+        const labelSpan = label ? label.querySelector('span') : null;
+        const selected = select.options[select.selectedIndex];
+        return {
+            kind: 'select',
+            label: labelSpan ? text(labelSpan) : 'Unknown',
+            options: Array.from(select.options).map(option => option.text.trim()),
+            value: selected ? selected.text.trim() : '',
+            element: select,
+        };
+    }
+
+    const fieldset = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (fieldset) return radioField(fieldset);
+
+    const input = question.querySelector('input[type="text"]');
+    if (input) {
+        const label = question.querySelector('label[for]');
+        const hidden = label ? label.querySelector('.visually-hidden') : null;
+        return { kind: 'text', label: label ? text(hidden || label) : 'Unknown', value: input.value, element: input };
+    }
+
+    const textarea = question.querySelector('textarea');
+    if (textarea) {
+        const label = question.querySelector('label[for]');
+        return { kind: 'textarea', label: label ? text(label) : 'Unknown', value: textarea.value, element: textarea };
+    }
+
+    const checkbox = question.querySelector('input[type="checkbox"]');
+    if (checkbox) {
+        const label = question.querySelector('span[class="visually-hidden"]');
+        const option = question.querySelector('label[for]');
+        return {
+            kind: 'checkbox',
+            label: label ? text(label) : 'Unknown',
+            option: option ? text(option) : 'Unknown',
+            value: checkbox.checked,
+            element: checkbox,
+        };
+    }
+    return null;
+}
+
+return Array.from(modal.querySelectorAll('div[data-test-form-element]')).map(describeQuestion).filter(field => field !== null);
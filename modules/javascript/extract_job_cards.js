@@ -0,0 +1,51 @@
+// Reads every job card on a LinkedIn search results page in one WebDriver call.
+// Run with driver.execute_async_script(script, maxWaitPerCard, maxWaitTotal), both in milliseconds.
+// Once maxWaitTotal is used up, unrendered cards are returned without waiting (with an empty title),
+// so a long list of them can't run into the WebDriver script timeout.
+// Returns a list of {element, link, id, title, subtitle, applied}, or {error} if something threw.
+
+const maxWaitPerCard = arguments[0];
+const maxWaitTotal = arguments[1];
+const started = performance.now();
+const done = arguments[arguments.length - 1];
+
+function firstLine(text) {
+    text = (text || '').trim();
+    const index = text.indexOf('\n');
+    return index === -1 ? text : text.slice(0, index);
+}
+
+function isRendered(card) {
+    return card.querySelector('a') !== null;
+}
+
+// LinkedIn only renders the cards near the viewport, the rest are empty <li>s until scrolled to
+async function waitUntilRendered(card) {
+    card.scrollIntoView({ block: 'center' });
+    const started = performance.now();
+    while (!isRendered(card) && performance.now() - started < maxWaitPerCard) {
+        await new Promise(resolve => setTimeout(resolve, 25));
+    }
+}
+
+async function extractJobCards() {
+    const cards = Array.from(document.querySelectorAll('li[data-occludable-job-id]'));
+    const results = [];
+    for (const card of cards) {
+        if (!isRendered(card) && performance.now() - started < maxWaitTotal) await waitUntilRendered(card);
+        const link = card.querySelector('a');
+        const subtitle = card.querySelector('.artdeco-entity-lockup__subtitle');
+        const jobState = card.querySelector('.job-card-container__footer-job-state');
+        results.push({
+            element: card,
+            link: link,
+            id: card.getAttribute('data-occludable-job-id'),
+            title: link ? firstLine(link.innerText) : '',
+            subtitle: subtitle ? subtitle.innerText.trim() : '',
+            applied: jobState ? jobState.innerText.trim() === 'Applied' : false,
+        });
+    }
+    return results;
+}
+
+extractJobCards().then(done, error => done({ error: String(error) }));
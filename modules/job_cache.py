@@ -0,0 +1,105 @@
+'''
+Cache of what the bot scraped or extracted for a job, keyed by job ID.
+
+Jobs come up again when they fail, are skipped, or match several search terms. Keeping the
+description, about-company text, extracted experience and AI-extracted skills saves scraping
+them from the page and paying for another LLM call. Entries older than `ttl_hours` are ignored
+and deleted when the cache is opened.
+
+The cache lives in the `job_cache` table of the history database.
+'''
+
+import json
+import threading
+from datetime import datetime, timedelta
+
+from modules.config_model import get_app_config
+from modules.database import SqliteDatabase
+
+FIELDS = ("description", "about_company", "experience_required", "skills")
+
+
+class JobCache:
+    """
+    Job ID -> `description`, `about_company`, `experience_required` and `skills`, each filled in as it becomes known.
+    * `get(job_id)` returns the fresh fields of a job, or `None`
+    * `put(job_id, **fields)` stores or updates some fields, leaving the others as they are
+    """
+
+    def __init__(self, db: SqliteDatabase, ttl_hours: float = 72) -> None:
+        self.db = db
+        self.ttl_hours = ttl_hours
+        with self.db.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_cache (job_id TEXT PRIMARY KEY, description TEXT, about_company TEXT, "
+                "experience_required TEXT, skills TEXT, cached_at TEXT NOT NULL)"
+            )
+        self.evict_expired()
+
+    def _cutoff(self) -> str:
+        return (datetime.now() - timedelta(hours=self.ttl_hours)).isoformat(" ", "seconds")
+
+    def get(self, job_id: str) -> dict | None:
+        if self.ttl_hours <= 0:
+            return None
+        with self.db.connection() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(FIELDS)} FROM job_cache WHERE job_id = ? AND cached_at >= ?", (job_id, self._cutoff())
+            ).fetchone()
+        if row is None:
+            return None
+        entry = {field: row[field] for field in FIELDS}
+        for field in ("experience_required", "skills"):
+            if entry[field] is not None:
+                entry[field] = json.loads(entry[field])
+        return entry
+
+    def put(self, job_id: str, **fields) -> None:
+        '''
+        Stores the given fields (see `FIELDS`) for `job_id`. Fields that are `None` are left unchanged.
+        * Error replies like `{"error": ...}` from the AI providers are not stored, so the next visit asks again
+        '''
+        if self.ttl_hours <= 0:
+            return
+        values = {
+            field: value for field, value in fields.items()
+            if field in FIELDS and value is not None and not (isinstance(value, dict) and "error" in value)
+        }
+        if not values:
+            return
+        for field in ("experience_required", "skills"):
+            if field in values:
+                values[field] = json.dumps(values[field], default=str)
+        columns = ["job_id", *values, "cached_at"]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"INSERT INTO job_cache ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT (job_id) DO UPDATE SET {updates}",
+                (job_id, *values.values(), datetime.now().isoformat(" ", "seconds")),
+            )
+
+    def evict_expired(self) -> int:
+        '''
+        Deletes entries older than `ttl_hours`. Returns how many were deleted.
+        '''
+        with self.db.transaction() as conn:
+            if self.ttl_hours <= 0:
+                return conn.execute("DELETE FROM job_cache").rowcount
+            return conn.execute("DELETE FROM job_cache WHERE cached_at < ?", (self._cutoff(),)).rowcount
+
+
+_cache: JobCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_job_cache() -> JobCache:
+    '''
+    Returns the process-wide job cache, kept in the history database, creating it on first use.
+    '''
+    global _cache
+    from modules.history_store import get_history_store
+    with _cache_lock:
+        if _cache is None:
+            _cache = JobCache(get_history_store().db, get_app_config().settings.job_cache_ttl_hours)
+        return _cache
@@ -12,65 +12,95 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
+import sys
 from modules.helpers import make_directories
-from modules.config_loader import get_config
+from modules.config_model import get_app_config
 from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
+from modules.browser_session import SessionManager
+from time import perf_counter
 
-config = get_config()
-settings = config.get('settings', {})
-questions = config.get('questions', {})
+config = get_app_config()
+settings = config.settings
+questions = config.questions
 
-run_in_background = settings.get('run_in_background', False)
-stealth_mode = settings.get('stealth_mode', True)
-disable_extensions = settings.get('disable_extensions', False)
-safe_mode = settings.get('safe_mode', False)
-file_name = settings.get('file_name', "all excels/all_applied_applications_history.csv")
-failed_file_name = settings.get('failed_file_name', "all excels/all_failed_applications_history.csv")
-logs_folder_path = settings.get('logs_folder_path', "logs/")
-generated_resume_path = settings.get('generated_resume_path', "all resumes/")
-default_resume_path = questions.get('default_resume_path', "all resumes/default/resume.pdf")
+run_in_background = settings.run_in_background
+stealth_mode = settings.stealth_mode
+disable_extensions = settings.disable_extensions
+safe_mode = settings.safe_mode
+file_name = settings.file_name
+failed_file_name = settings.failed_file_name
+logs_folder_path = settings.logs_folder_path
+generated_resume_path = settings.generated_resume_path
+default_resume_path = questions.default_resume_path
+driver_cache_path = settings.driver_cache_path
+keep_browser_warm = settings.keep_browser_warm
 
 if stealth_mode:
     import undetected_chromedriver as uc
+    from modules.driver_cache import launch_undetected_chrome
 else: 
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
     # from selenium.webdriver.chrome.service import Service
 
-try:
-    make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
-
-    # Set up WebDriver with Chrome Profile
+def make_options():
+    '''
+    Builds the Chrome options for the configured mode and profile.
+    '''
     options = uc.ChromeOptions() if stealth_mode else Options()
     if run_in_background:   options.add_argument("--headless")
     if disable_extensions:  options.add_argument("--disable-extensions")
-
-    print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
-    if safe_mode: 
-        print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
-    else:
+    if not safe_mode:
         profile_dir = find_default_profile_directory()
         if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
-        else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
-    if stealth_mode:
-        # try: 
-        #     driver = uc.Chrome(driver_executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe", options=options)
-        # except (FileNotFoundError, PermissionError) as e: 
-        #     print_lg("(Undetected Mode) Got '{}' when using pre-installed ChromeDriver.".format(type(e).__name__)) 
-            print_lg("Downloading Chrome Driver... This may take some time. Undetected mode requires download every run!")
-            driver = uc.Chrome(options=options)
-    else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
-    driver.maximize_window()
-    wait = WebDriverWait(driver, 5)
-    actions = ActionChains(driver)
-except Exception as e:
-    msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
-    if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
-    print_lg(msg)
-    critical_error_log("In Opening Chrome", e)
-    from pyautogui import alert
-    alert(msg, "Error in opening chrome")
-    try: driver.quit()
-    except NameError: exit()
+    return options
+
+def create_driver():
+    '''
+    Launches Chrome with the configured options and profile, or attaches to the warm browser if `keep_browser_warm` is on.
+    * Returns `(driver, wait, actions)`
+    * Shows what to try and exits if Chrome can't be started
+    '''
+    driver = None
+    try:
+        make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
+
+        # Set up WebDriver with Chrome Profile
+        print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
+        if safe_mode: 
+            print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
+        elif not find_default_profile_directory():
+            print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
+        if keep_browser_warm:
+            # Browser outlives the bot, so restarts skip the Chrome launch and LinkedIn login
+            print_lg("KEEP BROWSER WARM: Using a dedicated browser profile that stays open after the bot stops.")
+            arguments = [flag for enabled, flag in ((run_in_background, "--headless=new"), (disable_extensions, "--disable-extensions")) if enabled]
+            if stealth_mode:
+                # Attaching goes through plain selenium, only the patched chromedriver and this flag carry over from undetected-chromedriver
+                print_lg("WARNING: keep_browser_warm is on, so stealth_mode only partly applies. The warm browser uses the patched chromedriver and hides navigator.webdriver, but undetected-chromedriver's other protections are not active. Turn keep_browser_warm off for full stealth.")
+                arguments.append("--disable-blink-features=AutomationControlled")
+            driver = SessionManager(driver_cache_path, print_lg).get_driver(arguments, driver_cache_path if stealth_mode else None)
+        elif stealth_mode:
+            # Patched driver is cached per Chrome version, so it's only downloaded when Chrome updates
+            driver = launch_undetected_chrome(make_options, driver_cache_path, print_lg)
+        else:
+            started = perf_counter()
+            driver = webdriver.Chrome(options=make_options()) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
+            print_lg(f"Startup: browser launched in {perf_counter() - started:.2f}s")
+        driver.maximize_window()
+        wait = WebDriverWait(driver, 5)
+        actions = ActionChains(driver)
+        return driver, wait, actions
+    except Exception as e:
+        msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
+        if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+        print_lg(msg)
+        critical_error_log("In Opening Chrome", e)
+        from pyautogui import alert
+        alert(msg, "Error in opening chrome")
+        if driver:
+            try: driver.quit()
+            except Exception: pass
+        sys.exit(1)
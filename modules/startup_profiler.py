@@ -0,0 +1,41 @@
+import sys
+from time import perf_counter
+
+# Enabled by running `python runAiBot.py --profile-startup`
+ENABLED = "--profile-startup" in sys.argv
+
+
+class StartupProfiler:
+    """
+    Records how long each startup phase took, e.g. importing selenium or launching the browser.
+    * `mark(phase)` closes the current phase, timing it from the previous mark
+    * `report()` returns a table of all phases, slowest first
+    * When not `enabled`, marks are ignored and the report is empty
+    """
+
+    def __init__(self, enabled: bool = ENABLED) -> None:
+        self.enabled = enabled
+        self.started = perf_counter()
+        self._last = self.started
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self) -> str:
+        if not self.enabled:
+            return ""
+        total = self._last - self.started
+        lines = ["Startup profile:"]
+        for phase, seconds in sorted(self.phases, key=lambda item: item[1], reverse=True):
+            share = seconds / total * 100 if total else 0
+            lines.append(f"  {seconds:8.3f}s  {share:5.1f}%  {phase}")
+        lines.append(f"  {total:8.3f}s  100.0%  total")
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
@@ -1,7 +1,10 @@
+from modules.config_model import get_app_config
+
 
 def validate_config():
     """
-    Validation is currently disabled due to migration to JSON-based config.
-    Frontend inputs should be validated there.
+    Validates config.json by building the typed config model.
+    Raises `ConfigError` listing every invalid value, returns True otherwise.
     """
+    get_app_config()
     return True
@@ -0,0 +1,115 @@
+from typing import NamedTuple
+
+
+class WordMatch(NamedTuple):
+    word: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class WordMatcher:
+    """
+    Finds any of a list of words in a text in one pass, using an Aho-Corasick automaton built once.
+    * Matching is case-insensitive, words are lower-cased once when the matcher is built
+    * With `whole_words`, a word only matches where it isn't part of a longer word ("java" won't match "javascript")
+    * `find(text)` returns the first word found, `find_all(text)` every hit with where it was found
+    """
+    __slots__ = ("words", "whole_words", "_delta", "_outputs", "_lengths")
+
+    def __init__(self, words, whole_words: bool = False) -> None:
+        self.words = tuple(word for word in words if word)
+        self.whole_words = whole_words
+        self._lengths = tuple(len(word) for word in self.words)
+        self._build()
+
+    def _build(self) -> None:
+        # Trie of the lower-cased words, state 0 is the root
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[int, ...]] = [()]
+        for index, word in enumerate(self.words):
+            state = 0
+            for char in word.lower():
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (index,)
+
+        # Breadth first, so a state's failure link is final before its children need it.
+        # Each state's transitions are completed with its failure link's, making a DFA that never backtracks.
+        delta: list[dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        failure = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            delta[state] = {**delta[failure[state]], **goto[state]}
+            for char, child in goto[state].items():
+                failure[child] = delta[failure[state]].get(char, 0) if state else 0
+                outputs[child] += outputs[failure[child]]
+                queue.append(child)
+        self._delta = tuple(delta)
+        self._outputs = tuple(outputs)
+
+    def _scan(self, text: str, first_only: bool) -> list[WordMatch]:
+        delta = self._delta
+        outputs = self._outputs
+        lengths = self._lengths
+        words = self.words
+        whole_words = self.whole_words
+        lowered = text.lower()
+        size = len(lowered)
+        hits = []
+        state = 0
+        for position, char in enumerate(lowered):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            end = position + 1
+            for index in outputs[state]:
+                start = end - lengths[index]
+                if whole_words and (
+                    (start > 0 and _is_word_char(lowered[start]) and _is_word_char(lowered[start - 1]))
+                    or (end < size and _is_word_char(lowered[end - 1]) and _is_word_char(lowered[end]))
+                ):
+                    continue
+                hits.append(WordMatch(words[index], start, end))
+                if first_only:
+                    return hits
+        return hits
+
+    def find(self, text: str) -> str | None:
+        '''
+        Returns the first word found in `text` (the one that ends first), or `None`.
+        '''
+        if not self.words:
+            return None
+        hits = self._scan(text, True)
+        return hits[0].word if hits else None
+
+    def find_all(self, text: str) -> list[WordMatch]:
+        '''
+        Returns every hit in `text` as `(word, start, end)`, in the order they end in the text.
+        * Positions are indexes into `text.lower()`, the same as into `text` unless it has characters that change length when lower-cased
+        '''
+        if not self.words:
+            return []
+        return self._scan(text, False)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __bool__(self) -> bool:
+        return bool(self.words)
+
+    def __repr__(self) -> str:
+        return f"WordMatcher({self.words!r}, whole_words={self.whole_words})"
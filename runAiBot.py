@@ -14,12 +14,15 @@ version:    24.12.29.12.30
 
 # Imports
 import os
+import sys
 import csv
 import re
-import pyautogui
+import signal
 import json
 import time
 
+from modules.startup_profiler import profiler, ENABLED as PROFILE_STARTUP
+
 # Set CSV field size limit to prevent field size errors
 csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
 
@@ -32,142 +35,202 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, WebDriverException
+profiler.mark("Import selenium")
 
 # Load Configuration
-from modules.config_loader import get_config
-config = get_config()
+from modules.config_loader import diff_config, ConfigWatcher
+from modules.config_model import get_app_config, AppConfig, ConfigError
+try:
+    app_config = get_app_config()
+except ConfigError as e:
+    # Bad config is reported before the (slow) browser launch
+    print(f"Invalid config.json, please fix these values:\n{e}", file=sys.stderr)
+    sys.exit(1)
+profiler.mark("Load and validate config")
 
 # Unpack Configuration to Global Variables
 # Personals
-personals = config.get('personals', {})
-first_name = personals.get('first_name', "Sai").strip()
-middle_name = personals.get('middle_name', "Vignesh").strip()
-last_name = personals.get('last_name', "Golla").strip()
-phone_number = personals.get('phone_number', "9876543210")
-current_city = personals.get('current_city', "")
-street = personals.get('street', "")
-state = personals.get('state', "")
-zipcode = personals.get('zipcode', "")
-country = personals.get('country', "")
-ethnicity = personals.get('ethnicity', "Decline")
-gender = personals.get('gender', "Decline")
-disability_status = personals.get('disability_status', "Decline")
-veteran_status = personals.get('veteran_status', "Decline")
+personals = app_config.personals
+first_name = personals.first_name
+middle_name = personals.middle_name
+last_name = personals.last_name
+phone_number = personals.phone_number
+current_city = personals.current_city
+street = personals.street
+state = personals.state
+zipcode = personals.zipcode
+country = personals.country
+ethnicity = personals.ethnicity
+gender = personals.gender
+disability_status = personals.disability_status
+veteran_status = personals.veteran_status
 
 # Questions
-questions = config.get('questions', {})
-default_resume_path = questions.get('default_resume_path', "all resumes/default/resume.pdf")
-years_of_experience = questions.get('years_of_experience', "5")
-require_visa = questions.get('require_visa', "No")
-website = questions.get('website', "")
-linkedIn = questions.get('linkedIn', "")
-us_citizenship = questions.get('us_citizenship', "U.S. Citizen/Permanent Resident")
-desired_salary = questions.get('desired_salary', 120000)
-current_ctc = questions.get('current_ctc', 80000)
-notice_period = questions.get('notice_period', 30)
-linkedin_headline = questions.get('linkedin_headline', "")
-linkedin_summary = questions.get('linkedin_summary', "")
-cover_letter = questions.get('cover_letter', "")
-user_information_all = questions.get('user_information_all', "")
-recent_employer = questions.get('recent_employer', "Not Applicable")
-confidence_level = questions.get('confidence_level', "8")
-pause_before_submit = questions.get('pause_before_submit', True)
-pause_at_failed_question = questions.get('pause_at_failed_question', True)
-overwrite_previous_answers = questions.get('overwrite_previous_answers', False)
+questions = app_config.questions
+default_resume_path = questions.default_resume_path
+years_of_experience = questions.years_of_experience
+require_visa = questions.require_visa
+website = questions.website
+linkedIn = questions.linkedIn
+us_citizenship = questions.us_citizenship
+desired_salary = questions.desired_salary
+current_ctc = questions.current_ctc
+notice_period = questions.notice_period
+linkedin_headline = questions.linkedin_headline
+linkedin_summary = questions.linkedin_summary
+cover_letter = questions.cover_letter
+user_information_all = questions.user_information_all
+recent_employer = questions.recent_employer
+confidence_level = questions.confidence_level
+pause_before_submit = questions.pause_before_submit
+pause_at_failed_question = questions.pause_at_failed_question
+overwrite_previous_answers = questions.overwrite_previous_answers
 
 # Search
-search = config.get('search', {})
-search_terms = search.get('search_terms', [])
-search_location = search.get('search_location', "United States")
-switch_number = search.get('switch_number', 30)
-randomize_search_order = search.get('randomize_search_order', False)
-sort_by = search.get('sort_by', "")
-date_posted = search.get('date_posted', "Past week")
-salary = search.get('salary', "")
-easy_apply_only = search.get('easy_apply_only', True)
-experience_level = search.get('experience_level', [])
-job_type = search.get('job_type', [])
-on_site = search.get('on_site', [])
-companies = search.get('companies', [])
-location = search.get('location', [])
-industry = search.get('industry', [])
-job_function = search.get('job_function', [])
-job_titles = search.get('job_titles', [])
-benefits = search.get('benefits', [])
-commitments = search.get('commitments', [])
-under_10_applicants = search.get('under_10_applicants', False)
-in_your_network = search.get('in_your_network', False)
-fair_chance_employer = search.get('fair_chance_employer', False)
-pause_after_filters = search.get('pause_after_filters', True)
-about_company_bad_words = search.get('about_company_bad_words', [])
-about_company_good_words = search.get('about_company_good_words', [])
-bad_words = search.get('bad_words', [])
-security_clearance = search.get('security_clearance', False)
-did_masters = search.get('did_masters', False)
-current_experience = search.get('current_experience', 5)
+search = app_config.search
+search_terms = search.search_terms
+search_location = search.search_location
+switch_number = search.switch_number
+randomize_search_order = search.randomize_search_order
+sort_by = search.sort_by
+date_posted = search.date_posted
+salary = search.salary
+easy_apply_only = search.easy_apply_only
+experience_level = search.experience_level
+job_type = search.job_type
+on_site = search.on_site
+companies = search.companies
+location = search.location
+industry = search.industry
+job_function = search.job_function
+job_titles = search.job_titles
+benefits = search.benefits
+commitments = search.commitments
+under_10_applicants = search.under_10_applicants
+in_your_network = search.in_your_network
+fair_chance_employer = search.fair_chance_employer
+pause_after_filters = search.pause_after_filters
+security_clearance = search.security_clearance
+did_masters = search.did_masters
+current_experience = search.current_experience
 
 # Secrets
-secrets = config.get('secrets', {})
-username = secrets.get('username', "")
-password = secrets.get('password', "")
-use_AI = secrets.get('use_AI', False)
-ai_provider = secrets.get('ai_provider', "openai")
-llm_api_url = secrets.get('llm_api_url', "")
-llm_api_key = secrets.get('llm_api_key', "")
-llm_model = secrets.get('llm_model', "")
+secrets = app_config.secrets
+username = secrets.username
+password = secrets.password
+use_AI = secrets.use_AI
+ai_provider = secrets.ai_provider
+llm_api_url = secrets.llm_api_url
+llm_api_key = secrets.llm_api_key
+llm_model = secrets.llm_model
 
 # Settings
-settings = config.get('settings', {})
-close_tabs = settings.get('close_tabs', False)
-follow_companies = settings.get('follow_companies', False)
-run_non_stop = settings.get('run_non_stop', False)
-alternate_sortby = settings.get('alternate_sortby', True)
-cycle_date_posted = settings.get('cycle_date_posted', True)
-stop_date_cycle_at_24hr = settings.get('stop_date_cycle_at_24hr', True)
-generated_resume_path = settings.get('generated_resume_path', "all resumes/")
-file_name = settings.get('file_name', "all excels/all_applied_applications_history.csv")
-failed_file_name = settings.get('failed_file_name', "all excels/all_failed_applications_history.csv")
-logs_folder_path = settings.get('logs_folder_path', "logs/")
-click_gap = settings.get('click_gap', 1)
-run_in_background = settings.get('run_in_background', False)
-disable_extensions = settings.get('disable_extensions', False)
-safe_mode = settings.get('safe_mode', False)
-smooth_scroll = settings.get('smooth_scroll', False)
-keep_screen_awake = settings.get('keep_screen_awake', True)
-stealth_mode = settings.get('stealth_mode', True)
-showAiErrorAlerts = settings.get('showAiErrorAlerts', False)
+settings = app_config.settings
+close_tabs = settings.close_tabs
+follow_companies = settings.follow_companies
+run_non_stop = settings.run_non_stop
+alternate_sortby = settings.alternate_sortby
+cycle_date_posted = settings.cycle_date_posted
+stop_date_cycle_at_24hr = settings.stop_date_cycle_at_24hr
+generated_resume_path = settings.generated_resume_path
+file_name = settings.file_name
+failed_file_name = settings.failed_file_name
+logs_folder_path = settings.logs_folder_path
+click_gap = settings.click_gap
+run_in_background = settings.run_in_background
+disable_extensions = settings.disable_extensions
+safe_mode = settings.safe_mode
+smooth_scroll = settings.smooth_scroll
+keep_screen_awake = settings.keep_screen_awake
+stealth_mode = settings.stealth_mode
+showAiErrorAlerts = settings.showAiErrorAlerts
+config_reload_interval = settings.config_reload_interval
 
 # Derived variables
-full_name = first_name + " " + middle_name + " " + last_name if middle_name else first_name + " " + last_name
-desired_salary_lakhs = str(round(int(desired_salary) / 100000, 2))
-desired_salary_monthly = str(round(int(desired_salary)/12, 2))
-desired_salary = str(desired_salary)
-current_ctc_lakhs = str(round(int(current_ctc) / 100000, 2))
-current_ctc_monthly = str(round(int(current_ctc)/12, 2))
-current_ctc = str(current_ctc)
-notice_period_months = str(int(notice_period)//30)
-notice_period_weeks = str(int(notice_period)//7)
-notice_period = str(notice_period)
-
-if run_in_background == True:
-    pause_at_failed_question = False
-    pause_before_submit = False
-    run_non_stop = False
+full_name = personals.full_name
+
+def set_derived_variables() -> None:
+    '''
+    Sets the variables derived from config values (precomputed by `app_config`), again after a hot reload.
+    '''
+    global desired_salary_lakhs, desired_salary_monthly, desired_salary, current_ctc_lakhs, current_ctc_monthly, current_ctc
+    global notice_period_months, notice_period_weeks, notice_period, pause_at_failed_question, pause_before_submit, run_non_stop
+    questions = app_config.questions
+    desired_salary_lakhs = questions.desired_salary_lakhs
+    desired_salary_monthly = questions.desired_salary_monthly
+    desired_salary = str(questions.desired_salary)
+    current_ctc_lakhs = questions.current_ctc_lakhs
+    current_ctc_monthly = questions.current_ctc_monthly
+    current_ctc = str(questions.current_ctc)
+    notice_period_months = questions.notice_period_months
+    notice_period_weeks = questions.notice_period_weeks
+    notice_period = str(questions.notice_period)
+
+    if run_in_background == True:
+        pause_at_failed_question = False
+        pause_before_submit = False
+        run_non_stop = False
+
+set_derived_variables()
+
+# Config keys applied to the running bot by `reload_config()`, each is a global of the same name.
+# Anything else (login, browser, AI provider, file paths...) only takes effect after a restart.
+HOT_RELOAD_KEYS = {
+    "personals": (
+        "phone_number", "current_city", "street", "state", "zipcode", "country",
+        "ethnicity", "gender", "disability_status", "veteran_status"
+    ),
+    "questions": (
+        "years_of_experience", "require_visa", "website", "linkedIn", "us_citizenship", "desired_salary", "current_ctc",
+        "notice_period", "linkedin_headline", "linkedin_summary", "cover_letter", "user_information_all", "recent_employer",
+        "confidence_level", "pause_before_submit", "pause_at_failed_question", "overwrite_previous_answers"
+    ),
+    "search": (
+        "search_terms", "search_location", "switch_number", "randomize_search_order", "sort_by", "date_posted", "salary",
+        "easy_apply_only", "experience_level", "job_type", "on_site", "companies", "location", "industry", "job_function",
+        "job_titles", "benefits", "commitments", "under_10_applicants", "in_your_network", "fair_chance_employer",
+        "pause_after_filters", "security_clearance", "did_masters", "current_experience"
+    ),
+    "settings": (
+        "close_tabs", "follow_companies", "run_non_stop", "alternate_sortby", "cycle_date_posted", "stop_date_cycle_at_24hr",
+        "click_gap", "smooth_scroll", "keep_screen_awake", "showAiErrorAlerts"
+    ),
+}
+
+# Config keys the bot reads through `app_config` (as the `WordMatcher`s and sets built from them), so they
+# take effect by `reload_config()` replacing `app_config`, there is no global to update
+HOT_RELOAD_APP_CONFIG_KEYS = {
+    "search": (
+        "about_company_bad_words", "about_company_good_words", "bad_words", "title_bad_words",
+        "company_blacklist", "location_bad_words", "match_whole_words"
+    ),
+}
 
 # Modules Imports that depend on config
-from modules.open_chrome import *
+from modules.open_chrome import create_driver
 from modules.helpers import *
 from modules.clickers_and_finders import *
+import modules.clickers_and_finders as clickers_and_finders
 from modules.validator import validate_config
-
-if use_AI:
-    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
+from modules.history_store import get_history_store
+from modules.dedupe_index import get_dedupe_index
+from modules.job_cache import get_job_cache
+from modules.ai.response_cache import get_response_cache
+from modules.interaction import InteractionClient, ask_via_file
+from modules.dom_snapshots import extract_job_cards, unread_job_cards, read_job_card, extract_form_schema
+from modules.adaptive_wait import wait_for, settle, elements_present, job_list_rendered, modal_signature, modal_step_changed, stats as wait_stats
+from modules.ai.providers import load_provider
 
 from typing import Literal
 
-pyautogui.FAILSAFE = False
+# pyautogui is slow to import and only needed for popups, so it's loaded on first use
+pyautogui = lazy_import("pyautogui")
+profiler.mark("Import bot modules")
+
+# Browser, created in main()
+driver = None
+wait = None
+actions = None
 
 # Global state variables
 useNewResume = True
@@ -179,36 +242,66 @@ failed_count = 0
 skip_count = 0
 dailyEasyApplyLimitReached = False
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
+ai = None
 aiClient = None
 about_company_for_ai = None
+job_cache = None # False once it failed to open, e.g. with a history backend other than SQLite
+
+config_watcher = ConfigWatcher(config_reload_interval) if config_reload_interval > 0 else None
+
+def reload_config() -> None:
+    '''
+    Applies edits made to config.json while the bot is running.
+    * Only called at safe points (between jobs and search terms), all changed values are applied together
+    * Logs which keys took effect and which need a restart
+    '''
+    change = config_watcher.poll() if config_watcher else None
+    if not change: return
+    old, new = change
+    try:
+        new_app_config = AppConfig.from_dict(new)
+    except ConfigError as e:
+        print_lg(f"Ignoring config.json changes, it has invalid values:\n{e}")
+        return
+    updates, applied, needs_restart = {}, [], []
+    for section, key in sorted(diff_config(old, new), key=str):
+        name = f"{section}.{key}" if key else section
+        if key in HOT_RELOAD_KEYS.get(section, ()):
+            updates[key] = getattr(getattr(new_app_config, section), key)
+            applied.append(name)
+        elif key in HOT_RELOAD_APP_CONFIG_KEYS.get(section, ()):
+            applied.append(name)
+        else:
+            needs_restart.append(name)
+    if applied:
+        globals().update(updates, app_config=new_app_config)
+        set_derived_variables()
+        # Helper modules keep their own copies of these settings
+        for module in (clickers_and_finders,):
+            for key in ("click_gap", "smooth_scroll"):
+                if key in updates: setattr(module, key, updates[key])
+        print_lg(f"Config reloaded, applied: {', '.join(applied)}")
+    if needs_restart:
+        print_lg(f"Config changes that need a bot restart to take effect: {', '.join(needs_restart)}")
 
-INTERACTION_FILE = 'interaction.json'
+
+interaction_client = None
 
 def ask_user_input(prompt: str) -> str:
-    """Writes prompt to interaction file and waits for response."""
+    """Asks the user through the dashboard and waits for the response."""
+    global interaction_client
     print_lg(f"Waiting for user input: {prompt}")
     
-    # Write request
-    with open(INTERACTION_FILE, 'w') as f:
-        json.dump({"status": "waiting", "prompt": prompt}, f)
-        
-    # Poll for response
-    while True:
+    # Answers come straight back over the supervisor channel, the interaction file is only a fallback
+    if interaction_client is None:
+        interaction_client = InteractionClient.from_env() or False
+    if interaction_client:
         try:
-            time.sleep(1)
-            if os.path.exists(INTERACTION_FILE):
-                with open(INTERACTION_FILE, 'r') as f:
-                    data = json.load(f)
-                
-                if data.get("status") == "responded":
-                    response = data.get("response", "")
-                    # Clear status
-                    with open(INTERACTION_FILE, 'w') as f:
-                        json.dump({"status": "idle"}, f)
-                    return response
-        except Exception as e:
-            print_lg(f"Error checking interaction: {e}")
-            time.sleep(1)
+            return interaction_client.ask(prompt)
+        except (EOFError, OSError) as e:
+            print_lg(f"Lost connection to the dashboard, falling back to interaction file: {e}")
+            interaction_client = False
+    return ask_via_file(prompt)
 
 
 #< Login Functions
@@ -259,17 +352,62 @@ def login_LN() -> None:
 
 
 def get_applied_job_ids() -> set[str]:
-    job_ids: set[str] = set()
     try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+        return get_history_store().applied_job_ids()
+    except Exception as e:
+        print_lg("Failed to read applied jobs history!", e)
+        return set()
+
+
+def get_dedupe_sets() -> tuple:
+    '''
+    Returns the applied jobs, rejected jobs and blacklisted companies sets, kept across runs in the dedupe index.
+    * Called at the start of every `apply_to_jobs()` cycle, so keys other writers added since are picked up
+    * Falls back to in-memory sets (applied jobs read from history) if the index can't be opened
+    '''
+    try:
+        dedupe = get_dedupe_index()
+        dedupe.refresh()
+        return dedupe.keys("applied"), dedupe.keys("rejected"), dedupe.keys("blacklisted_company")
+    except Exception as e:
+        print_lg("Failed to open the applied/rejected jobs index, rejected jobs will only be remembered for this run!", e)
+        return get_applied_job_ids(), set(), set()
+
+
+def cached_job(job_id: str) -> dict | None:
+    '''
+    Returns what was scraped or extracted for `job_id` on an earlier visit, or `None`.
+    * Cache failures only cost a re-scrape, so they're logged and ignored
+    '''
+    global job_cache
+    if job_cache is False:
+        return None
+    if job_cache is None:
+        try:
+            job_cache = get_job_cache()
+        except Exception as e:
+            job_cache = False
+            print_lg("Failed to open the job cache, jobs will be scraped on every visit!", e)
+            return None
+    try:
+        return job_cache.get(job_id)
+    except Exception as e:
+        print_lg("Failed to read the job cache, scraping the job again!", e)
+        return None
+
+
+def cache_job(job_id: str, **fields) -> None:
+    try:
+        if job_cache:
+            job_cache.put(job_id, **fields)
+    except Exception as e:
+        print_lg("Failed to cache job details!", e)
+
 
 
+# Typeahead suggestions shown under location inputs
+LOCATION_SUGGESTIONS = "//*[@role='listbox']//*[@role='option']"
+SHOW_RESULTS_BUTTON = '//button[contains(@class, "artdeco-button") and contains(., "Show") and contains(., "result")]'
 
 def set_search_location() -> None:
     if search_location.strip():
@@ -282,7 +420,7 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            wait_for(driver, elements_present(By.XPATH, LOCATION_SUGGESTIONS), "location suggestions", timeout=2)
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -432,7 +570,7 @@ def apply_filters_via_all_filters() -> bool:
         # Click "All filters" button
         all_filters_btn = wait.until(EC.element_to_be_clickable((By.XPATH, '//button[contains(., "All filters")]')))
         all_filters_btn.click()
-        buffer(2)
+        wait_for(driver, elements_present(By.XPATH, SHOW_RESULTS_BUTTON), "all filters modal", timeout=5, floor=buffer_floor(click_gap))
         
         recommended_wait = 1 if click_gap < 1 else 0
         
@@ -513,9 +651,9 @@ def apply_filters_via_all_filters() -> bool:
         
         # Click "Show results" button
         try:
-            show_results_btn = driver.find_element(By.XPATH, '//button[contains(@class, "artdeco-button") and contains(., "Show") and contains(., "result")]')
+            show_results_btn = driver.find_element(By.XPATH, SHOW_RESULTS_BUTTON)
             show_results_btn.click()
-            buffer(2)
+            settle(driver, "filtered results", buffer_floor(click_gap), ready=job_list_rendered())
             print_lg("Clicked Show results button")
         except Exception as e:
             print_lg(f"Could not find Show results button: {e}")
@@ -539,7 +677,7 @@ def apply_filters() -> None:
     set_search_location()
 
     try:
-        buffer(2)  # Wait for page to load
+        settle(driver, "search page", buffer_floor(click_gap), ready=job_list_rendered())
         
         # Step 1: Apply Easy Apply quick filter (if enabled)
         if easy_apply_only:
@@ -562,7 +700,7 @@ def apply_filters() -> None:
         if has_advanced_filters:
             apply_filters_via_all_filters()
         
-        buffer(2)  # Wait for results to load
+        settle(driver, "search results", buffer_floor(click_gap), ready=job_list_rendered())
         
         global pause_after_filters
         if pause_after_filters:
@@ -598,25 +736,32 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
     return pagination_element, current_page
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+def prescreen_card(card: dict) -> tuple[str, str] | None:
+    '''
+    Checks what the results list already shows about a job (title, company, location, work style) against the config.
+    * Returns `(reason, message)` if the job should be skipped without opening it, else `None`
+    '''
+    search = app_config.search
+    word = search.title_bad_words_list.find(card["title"])
+    if word:
+        return "Found a Bad Word in Job Title", f'Title contains bad word "{word}"'
+    if card["company"].strip().lower() in search.company_blacklist_set:
+        return "Blacklisted Company", f'Company "{card["company"]}" is in company_blacklist'
+    if search.on_site_set and card["work_style"] and card["work_style"].lower() not in search.on_site_set:
+        return "Work style not wanted", f'Work style "{card["work_style"]}" is not one of {", ".join(search.on_site)}'
+    word = search.location_bad_words_list.find(card["work_location"])
+    if word:
+        return "Found a Bad Word in Job Location", f'Location "{card["work_location"]}" contains bad word "{word}"'
+    return None
+
+
+def get_job_main_details(card: dict, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
     try:
-        job_details_button = job.find_element(By.TAG_NAME, 'a') 
-        scroll_to_view(driver, job_details_button, True)
-        job_id = job.get_dom_attribute('data-occludable-job-id')
-        title = job_details_button.text
-        title = title[:title.find("\n")] if "\n" in title else title
-        other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-        index = other_details.find(' · ')
-        if index == -1:
-            # Fallback if format is different
-            company = other_details.split('\n')[0] if '\n' in other_details else other_details
-            work_location = ""
-            work_style = ""
-        else:
-            company = other_details[:index]
-            work_location = other_details[index+3:]
-            work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
-            work_location = work_location[:work_location.rfind('(')].strip() if '(' in work_location else work_location
+        job_id = card["id"]
+        title = card["title"]
+        company = card["company"]
+        work_location = card["work_location"]
+        work_style = card["work_style"]
         
         skip = False
         if company in blacklisted_companies:
@@ -625,13 +770,13 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
         elif job_id in rejected_jobs: 
             print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
             skip = True
-        try:
-            if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-                skip = True
-                print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-        except: pass
+        elif card["applied"]:
+            skip = True
+            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
         
         if not skip:
+            job_details_button = card["link"]
+            scroll_to_view(driver, job_details_button, True)
             try: 
                 job_details_button.click()
             except Exception as e:
@@ -642,8 +787,8 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
                 except Exception as e2:
                     print_lg(f'Retry click also failed, skipping this job. Error: {e2}')
                     skip = True
+            buffer(click_gap)
         
-        buffer(click_gap)
         return (job_id, title, company, work_location, work_style, skip)
         
     except Exception as e:
@@ -652,24 +797,28 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
         return ("unknown", "Unknown", "Unknown", "", "", True)
 
 
-def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> tuple[set, set, WebElement] | ValueError:
+def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set, cached: dict | None = None) -> tuple[set, set, WebElement] | ValueError:
     jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
-    about_company_org = find_by_class(driver, "jobs-company__box")
-    scroll_to_view(driver, about_company_org)
-    about_company_org = about_company_org.text
+    if cached and cached["about_company"] is not None:
+        about_company_org = cached["about_company"]
+    else:
+        about_company_org = find_by_class(driver, "jobs-company__box")
+        scroll_to_view(driver, about_company_org)
+        about_company_org = about_company_org.text
+        cache_job(job_id, about_company=about_company_org)
     about_company = about_company_org.lower()
     skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
+    word = app_config.search.about_company_good_words_list.find(about_company)
+    if word:
+        print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
+        skip_checking = True
     if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+        hits = app_config.search.about_company_bad_words_list.find_all(about_company_org)
+        if hits:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            found = ", ".join(f'"{hit.word}" (at {hit.start})' for hit in hits)
+            raise ValueError(f'\n"{about_company_org}"\n\nContains {found}.')
     buffer(click_gap)
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
@@ -683,22 +832,26 @@ def extract_years_of_experience(text: str) -> int:
     return max([int(match) for match in matches if int(match) <= 12])
 
 
-def get_job_description() -> tuple[str | Literal['Unknown'], int | Literal['Unknown'], bool, str | None, str | None]:
+def get_job_description(job_id: str, cached: dict | None = None) -> tuple[str | Literal['Unknown'], int | Literal['Unknown'], bool, str | None, str | None]:
     try:
         jobDescription = "Unknown"
         experience_required = "Unknown"
         found_masters = 0
-        jobDescription = find_by_class(driver, "jobs-box__html-content").text
+        if cached and cached["description"] is not None:
+            jobDescription = cached["description"]
+        else:
+            jobDescription = find_by_class(driver, "jobs-box__html-content").text
+            cache_job(job_id, description=jobDescription)
         jobDescriptionLow = jobDescription.lower()
         skip = False
         skipReason = None
         skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
+        hits = app_config.search.bad_words_list.find_all(jobDescription)
+        if hits:
+            found = ", ".join(f'"{hit.word}" (at {hit.start})' for hit in hits)
+            skipMessage = f'\n{jobDescription}\n\nContains bad words {found}. Skipping this job!\n'
+            skipReason = "Found a Bad Word in About Job"
+            skip = True
         if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
             skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
             skipReason = "Asking for Security clearance"
@@ -707,7 +860,11 @@ def get_job_description() -> tuple[str | Literal['Unknown'], int | Literal['Unkn
             if did_masters and 'master' in jobDescriptionLow:
                 print_lg(f'Found the word "master" in \n{jobDescription}')
                 found_masters = 2
-            experience_required = extract_years_of_experience(jobDescription)
+            if cached and cached["experience_required"] is not None:
+                experience_required = cached["experience_required"]
+            else:
+                experience_required = extract_years_of_experience(jobDescription)
+                cache_job(job_id, experience_required=experience_required)
             if current_experience > -1 and experience_required > current_experience + found_masters:
                 skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
                 skipReason = "Required experience is high"
@@ -733,25 +890,22 @@ def answer_common_questions(label: str, answer: str) -> str:
 
 
 def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None ) -> set:
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
+    # The whole form is read in one call, only filling in answers goes back to the browser
+    all_questions = extract_form_schema(driver, modal)
 
     for Question in all_questions:
+        kind = Question["kind"]
         # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
+        if kind == "select":
+            label_org = Question["label"]
             answer = 'Yes'
             label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
+            select = Select(Question["element"])
+            selected_option = Question["value"]
             optionsText = []
             options = '"List of phone country codes"'
             if label != "phone country code":
-                optionsText = [option.text for option in select.options]
+                optionsText = Question["options"]
                 options = "".join([f' "{option}",' for option in optionsText])
             prev_answer = selected_option
             if overwrite_previous_answers or selected_option == "Select an option":
@@ -799,32 +953,27 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                                 break
                     if not foundOption:
                         print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
-                        select.select_by_index(randint(1, len(select.options)-1))
-                        answer = select.first_selected_option.text
+                        index = randint(1, len(Question["options"])-1)
+                        select.select_by_index(index)
+                        answer = Question["options"][index]
                         randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
             questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
             continue
         
         # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
+        if kind == "radio":
             prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
+            label_org = Question["label"]
             answer = 'Yes'
             label = label_org.lower()
 
             label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
+            options = Question["options"]
             options_labels = []
             
             for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
+                options_labels.append( f'"{option["label"]}"<{option["value"]}>' ) # Saving option as "label <value>"
+                if option["selected"]: prev_answer = options_labels[-1]
                 label_org += f' {options_labels[-1]},'
 
             if overwrite_previous_answers or prev_answer is None:
@@ -833,17 +982,17 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 elif 'disability' in label or 'handicapped' in label: 
                     answer = disability_status
                 else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
+                foundOption = next((option["label_element"] for option in options if option["label_element"] and option["label"] == answer), False)
                 if foundOption: 
                     actions.move_to_element(foundOption).click().perform()
                 else:    
                     possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
-                    ele = options[0]
+                    ele = options[0]["element"]
                     answer = options_labels[0]
                     for phrase in possible_answer_phrases:
                         for i, option_label in enumerate(options_labels):
                             if phrase in option_label:
-                                foundOption = options[i]
+                                foundOption = options[i]["element"]
                                 ele = foundOption
                                 answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
                                 break
@@ -855,17 +1004,15 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             continue
         
         # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text: 
+        if kind == "text": 
+            text = Question["element"]
             do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
+            label_org = Question["label"]
             answer = "" 
             label = label_org.lower()
 
-            prev_answer = text.get_attribute("value")
+            prev_answer = Question["value"]
+            value = prev_answer
             if not prev_answer or overwrite_previous_answers:
                 if 'experience' in label or 'years' in label: answer = years_of_experience
                 elif 'phone' in label or 'mobile' in label: answer = phone_number
@@ -915,15 +1062,7 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 if answer == "":
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
+                            answer = ai.answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
                             else:
@@ -939,21 +1078,23 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 
                 text.clear()
                 text.send_keys(answer)
+                value = str(answer)
                 if do_actions:
-                    sleep(2)
+                    wait_for(driver, elements_present(By.XPATH, LOCATION_SUGGESTIONS), "location suggestions", timeout=2)
                     actions.send_keys(Keys.ARROW_DOWN)
                     actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
+                    # The location suggestion picked may differ from what was typed
+                    value = text.get_attribute("value")
+            questions_list.add((label, value, "text", prev_answer))
             continue
 
         # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
+        if kind == "textarea":
+            text_area = Question["element"]
+            label_org = Question["label"]
             label = label_org.lower()
             answer = ""
-            prev_answer = text_area.get_attribute("value")
+            prev_answer = Question["value"]
             if not prev_answer or overwrite_previous_answers:
                 if 'summary' in label: answer = linkedin_summary
                 elif 'cover' in label: 
@@ -964,15 +1105,7 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                 if answer == "":
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
+                            answer = ai.answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
                             else:
@@ -986,22 +1119,16 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
                         randomly_answered_questions.add((label_org, "textarea"))
             text_area.clear()
             text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
             questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
             continue
 
         # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
+        if kind == "checkbox":
+            checkbox = Question["element"]
+            label_org = Question["label"]
             label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
+            answer = Question["option"]
+            prev_answer = Question["value"]
             checked = prev_answer
             if not prev_answer:
                 try:
@@ -1045,7 +1172,8 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
         return True, application_link, tabs_count
 
 
-def follow_company(modal: WebDriver = driver) -> None:
+def follow_company(modal: WebDriver | None = None) -> None:
+    if modal is None: modal = driver
     try:
         follow_checkbox_input = try_xp(modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False)
         if follow_checkbox_input and follow_checkbox_input.is_selected() != follow_companies:
@@ -1056,12 +1184,7 @@ def follow_company(modal: WebDriver = driver) -> None:
 
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     try:
-        with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
-            file.close()
+        get_history_store().add_failed({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
         # pyautogui.alert("Failed to update the excel of failed jobs!", "Failed Logging")
@@ -1079,16 +1202,11 @@ def submitted_jobs(job_id: str, title: str, company: str, work_location: str, wo
                    reposted: bool, date_listed: datetime | Literal['Unknown'], date_applied:  datetime | Literal['Pending'], job_link: str, application_link: str, 
                    questions_list: set | None, connect_request: Literal['In Development']) -> None:
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
+        get_history_store().add_applied({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
                             'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
                                 'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
                                 'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
                                 'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
-        csv_file.close()
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
         # pyautogui.alert("Failed to update the excel of applied jobs!", "Failed Logging")
@@ -1100,14 +1218,14 @@ def discard_job() -> None:
 
 
 def apply_to_jobs(search_terms: list[str]) -> None:
-    applied_jobs = get_applied_job_ids()
-    rejected_jobs = set()
-    blacklisted_companies = set()
+    applied_jobs, rejected_jobs, blacklisted_companies = get_dedupe_sets()
     global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
     current_city = current_city.strip()
 
+    search_terms = list(search_terms) # Config values are read-only tuples
     if randomize_search_order:  shuffle(search_terms)
     for searchTerm in search_terms:
+        reload_config()
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg("\n________________________________________________________________________________________________________________________\n")
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
@@ -1122,17 +1240,41 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
                 pagination_element, current_page = get_page_info()
 
-                # Find all job listings in current page
-                buffer(3)
-                job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
+                # Read all job listings in current page at once, only the jobs that pass the checks get clicked
+                settle(driver, "results page", buffer_floor(click_gap), ready=job_list_rendered())
+                try:
+                    job_listings = extract_job_cards(driver)
+                except Exception as e:
+                    print_lg("Couldn't read the job cards in one go, reading them one by one.", e)
+                    job_listings = unread_job_cards(driver)
 
             
                 for job in job_listings:
                     try:
                         if keep_screen_awake: pyautogui.press('shiftright')
+                        reload_config()
                         if current_count >= switch_number: break
                         print_lg("\n-@-\n")
 
+                        if not job["title"]:
+                            # Card wasn't rendered when the page was read, read it the slow way
+                            scroll_to_view(driver, job["element"], True)
+                            job = read_job_card(job["element"])
+
+                        if job["id"] in applied_jobs:
+                            print_lg(f'Already applied to "{job["title"]} | {job["company"]}" job. Job ID: {job["id"]}!')
+                            continue
+
+                        # Skip what the card alone rules out, before paying for opening the job
+                        prescreen = prescreen_card(job)
+                        if prescreen and job["id"] not in rejected_jobs:
+                            reason, message = prescreen
+                            print_lg(f'Skipping "{job["title"]} | {job["company"]}" job. {message}. Job ID: {job["id"]}!')
+                            failed_job(job["id"], "https://www.linkedin.com/jobs/view/"+job["id"], "Pending", "Unknown", reason, message, "Skipped", "Not Available")
+                            rejected_jobs.add(job["id"])
+                            skip_count += 1
+                            continue
+
                         job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
                         
                         if skip: continue
@@ -1158,9 +1300,10 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     reposted = False
                     questions_list = None
                     screenshot_name = "Not Available"
+                    cached = cached_job(job_id)
 
                     try:
-                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies)
+                        rejected_jobs, blacklisted_companies, jobs_top_card = check_blacklist(rejected_jobs,job_id,company,blacklisted_companies,cached)
                     except ValueError as e:
                         print_lg(e, 'Skipping this job!\n')
                         failed_job(job_id, job_link, resume, date_listed, "Found Blacklisted words in About Company", e, "Skipped", screenshot_name)
@@ -1189,7 +1332,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         print_lg("Failed to calculate the date posted!",e)
 
 
-                    description, experience_required, skip, reason, message = get_job_description()
+                    description, experience_required, skip, reason, message = get_job_description(job_id, cached)
                     if skip:
                         print_lg(message)
                         failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
@@ -1200,15 +1343,13 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     
                     if use_AI and description != "Unknown":
                         try:
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
+                            if cached and cached["skills"] is not None:
+                                skills = cached["skills"]
+                                print_lg("Using skills extracted on an earlier visit to this job")
                             else:
-                                skills = "In Development"
-                            print_lg(f"Extracted skills using {ai_provider} AI")
+                                skills = ai.extract_skills(aiClient, description)
+                                cache_job(job_id, skills=skills)
+                                print_lg(f"Extracted skills using {ai_provider} AI")
                         except Exception as e:
                             print_lg("Failed to extract skills:", e)
                             skills = "Error extracting skills"
@@ -1240,9 +1381,10 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     if useNewResume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
                                     try: next_button = modal.find_element(By.XPATH, './/span[normalize-space(.)="Review"]') 
                                     except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
+                                    step = modal_signature(driver, modal)
                                     try: next_button.click()
                                     except ElementClickInterceptedException: break    
-                                    buffer(click_gap)
+                                    wait_for(driver, modal_step_changed(modal, step), "easy apply next step", timeout=3, floor=buffer_floor(click_gap))
 
                             except NoSuchElementException: errored = "nose"
                             finally:
@@ -1330,6 +1472,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 def run(total_runs: int) -> int:
     if dailyEasyApplyLimitReached:
         return total_runs
+    reload_config()
     print_lg("\n########################################################################################################################\n")
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
@@ -1350,10 +1493,18 @@ linkedIn_tab = False
 
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume, aiClient, ai, driver, wait, actions
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
+        pyautogui.FAILSAFE = False
+
+        if use_AI:
+            ai = load_provider(ai_provider)
+            profiler.mark(f"Import {ai.name} AI provider")
+
+        driver, wait, actions = create_driver()
+        profiler.mark("Launch browser")
         
         if not os.path.exists(default_resume_path):
             # pyautogui.alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
@@ -1364,22 +1515,24 @@ def main() -> None:
         tabs_count = len(driver.window_handles)
         driver.get("https://www.linkedin.com/login")
         if not is_logged_in_LN(): login_LN()
+        profiler.mark("Log in to LinkedIn")
         
         linkedIn_tab = driver.current_window_handle
 
         if use_AI:
-            if ai_provider == "openai":
-                aiClient = ai_create_openai_client()
-            elif ai_provider == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider == "gemini":
-                aiClient = gemini_create_client()
+            aiClient = ai.create_client()
+            profiler.mark(f"Create {ai.name} AI client")
 
             try:
                 about_company_for_ai = " ".join([word for word in (first_name+" "+last_name).split() if len(word) > 3])
                 print_lg(f"Extracted about company info for AI: '{about_company_for_ai}'")
             except Exception as e:
                 print_lg("Failed to extract about company info!", e)
+
+        if PROFILE_STARTUP:
+            print_lg(profiler.report())
+            print_lg("Started with --profile-startup, exiting before applying to any jobs.")
+            return
         
         driver.switch_to.window(linkedIn_tab)
         total_runs = run(total_runs)
@@ -1411,19 +1564,19 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        if wait_stats: print_lg(wait_stats.report())
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         
-        if use_AI and aiClient:
+        if ai and aiClient:
             try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "gemini":
-                    pass 
+                ai.close_client(aiClient)
                 print_lg(f"Closed {ai_provider} AI client.")
             except Exception as e:
                 print_lg("Failed to close AI client:", e)
+            try:
+                print_lg(get_response_cache().report())
+            except Exception as e:
+                print_lg("Failed to read AI response cache stats:", e)
         try:
             if driver:
                 driver.quit()
@@ -1434,4 +1587,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # "Stop Bot" in the dashboard sends SIGTERM, exit through main()'s cleanup so buffered logs get written
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     main()